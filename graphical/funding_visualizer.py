@@ -3,6 +3,7 @@ Funding Configuration Visualizer
 Generates various graphical representations of funding configurations.
 """
 
+from functools import wraps
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from metamodel.funding_metamodel import (
@@ -11,12 +12,32 @@ from metamodel.funding_metamodel import (
 )
 
 
+def _cached(method):
+    """Cache a generator method's output per visualizer instance.
+
+    The generators are pure functions of the configuration, so once a
+    diagram string has been built for a visualizer it can be reused by
+    later calls (including the convenience wrappers) for free.
+    """
+    key = method.__name__
+
+    @wraps(method)
+    def wrapper(self):
+        result = self._cache.get(key)
+        if result is None:
+            result = self._cache[key] = method(self)
+        return result
+    return wrapper
+
+
 class FundingVisualizer:
     """Main class for generating visual representations of funding configurations"""
     
     def __init__(self, config: FundingConfiguration):
         self.config = config
+        self._cache: Dict[str, str] = {}
     
+    @_cached
     def generate_mermaid_flowchart(self) -> str:
         """
         Generate a Mermaid flowchart showing the funding flow structure
@@ -105,6 +126,7 @@ class FundingVisualizer:
         
         return "\n".join(lines)
     
+    @_cached
     def generate_mermaid_pie_chart(self) -> str:
         """
         Generate a Mermaid pie chart showing funding source distribution
@@ -126,6 +148,7 @@ class FundingVisualizer:
         
         return "\n".join(lines)
     
+    @_cached
     def generate_mermaid_timeline(self) -> str:
         """
         Generate a Mermaid timeline showing funding goals progression
@@ -162,6 +185,7 @@ class FundingVisualizer:
         
         return "\n".join(lines)
     
+    @_cached
     def generate_mermaid_class_diagram(self) -> str:
         """
         Generate a Mermaid class diagram showing the funding structure
@@ -231,6 +255,7 @@ class FundingVisualizer:
         
         return "\n".join(lines)
     
+    @_cached
     def generate_ascii_overview(self) -> str:
         """
         Generate an ASCII art overview of the funding configuration
@@ -307,6 +332,7 @@ class FundingVisualizer:
         
         return "\n".join(lines)
     
+    @_cached
     def generate_funding_matrix(self) -> str:
         """
         Generate a matrix showing the relationship between beneficiaries and funding sources
@@ -26,27 +26,32 @@ class VisualElement:
         self.y = y
         self.width = width
         self.height = height
+        # Bounding box cached for hit-testing; contains_point is on the
+        # hot path for mouse events, so avoid recomputing bounds per call
+        self._bbox = (x, y, x + width, y + height)
         self.selected = False
         self.canvas_id = None
         self.text_id = None
-        
+
     def draw(self):
         """Draw the element on the canvas"""
         pass
-    
+
     def move(self, dx: int, dy: int):
         """Move the element by dx, dy"""
         self.x += dx
         self.y += dy
+        x0, y0, x1, y1 = self._bbox
+        self._bbox = (x0 + dx, y0 + dy, x1 + dx, y1 + dy)
         if self.canvas_id:
             self.canvas.move(self.canvas_id, dx, dy)
         if self.text_id:
             self.canvas.move(self.text_id, dx, dy)
-    
+
     def contains_point(self, x: int, y: int) -> bool:
         """Check if point (x, y) is inside this element"""
-        return (self.x <= x <= self.x + self.width and 
-                self.y <= y <= self.y + self.height)
+        x0, y0, x1, y1 = self._bbox
+        return x0 <= x <= x1 and y0 <= y <= y1
     
     def set_selected(self, selected: bool):
         """Set selection state"""
@@ -9,8 +9,45 @@ from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
 
+try:
+    # Optional fast path: with numba/numpy installed the numeric validation
+    # checks run as a compiled kernel over packed float arrays
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = None
 
-class FundingPlatform(Enum):
+    def _njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@_njit(cache=True)
+def _count_nonneg_violations(values):
+    """Count negative entries in a packed array of amounts"""
+    count = 0
+    for i in range(values.shape[0]):
+        if values[i] < 0.0:
+            count += 1
+    return count
+
+
+class _ValueLookupEnum(Enum):
+    """Enum base with a direct by-value lookup.
+
+    Enum.__call__ goes through a generic dispatch wrapper; from_value hits
+    the value-to-member map directly, which matters on hot
+    serialization/deserialization paths with many elements.
+    """
+
+    @classmethod
+    def from_value(cls, value):
+        """Look up a member by its value"""
+        return cls._value2member_map_[value]
+
+
+class FundingPlatform(_ValueLookupEnum):
     """Enumeration of supported funding platforms"""
     GITHUB_SPONSORS = "github"
     PATREON = "patreon"
@@ -27,14 +64,14 @@ class FundingPlatform(Enum):
     CUSTOM = "custom"
 
 
-class FundingType(Enum):
+class FundingType(_ValueLookupEnum):
     """Types of funding arrangements"""
     ONE_TIME = "one_time"
     RECURRING = "recurring"
     BOTH = "both"
 
 
-class CurrencyType(Enum):
+class CurrencyType(_ValueLookupEnum):
     """Supported currencies"""
     USD = "USD"
     EUR = "EUR"
@@ -43,7 +80,10 @@ class CurrencyType(Enum):
     AUD = "AUD"
 
 
-@dataclass
+# The model dataclasses use slots=True: parsers build many of these objects,
+# and dropping the per-instance __dict__ roughly halves their memory footprint
+# while speeding up attribute access
+@dataclass(slots=True)
 class FundingAmount:
     """Represents a monetary amount with currency"""
     value: float
@@ -53,7 +93,7 @@ class FundingAmount:
         return f"{self.value} {self.currency.value}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Beneficiary:
     """Represents an individual or organization that receives funding"""
     name: str
@@ -66,7 +106,7 @@ class Beneficiary:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingTier:
     """Represents a sponsorship tier with specific benefits"""
     name: str
@@ -80,7 +120,7 @@ class FundingTier:
         return f"{self.name} ({self.amount})"
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingGoal:
     """Represents a funding milestone or target"""
     name: str
@@ -101,7 +141,7 @@ class FundingGoal:
         return f"{self.name}: {self.current_amount}/{self.target_amount}"
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingSource:
     """Represents a specific funding platform configuration"""
     platform: FundingPlatform
@@ -115,7 +155,7 @@ class FundingSource:
         return f"{self.platform.value}: {self.username}"
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingConfiguration:
     """Main configuration for a project's funding setup"""
     project_name: str
@@ -224,6 +264,23 @@ class FundingModelValidator:
                 if not source.username.startswith('u/gh/'):
                     errors.append("Thanks.dev username must be in format 'u/gh/username'")
         
+        # Numeric checks: pack the amounts and scan them in one pass
+        # (compiled with numba when available, plain Python otherwise)
+        if config.min_amount and config.max_amount:
+            if config.min_amount.value > config.max_amount.value:
+                errors.append("Minimum amount cannot exceed maximum amount")
+
+        amounts = [tier.amount.value for tier in config.tiers]
+        amounts.extend(goal.target_amount.value for goal in config.goals)
+        amounts.extend(goal.current_amount.value for goal in config.goals)
+        if _np is not None:
+            negatives = _count_nonneg_violations(
+                _np.asarray(amounts, dtype=_np.float64))
+        else:
+            negatives = sum(1 for value in amounts if value < 0.0)
+        if negatives:
+            errors.append("Tier and goal amounts must be non-negative")
+
         # Validate tiers have unique names
         tier_names = [tier.name for tier in config.tiers]
         if len(tier_names) != len(set(tier_names)):
@@ -0,0 +1,31 @@
+"""
+Shared fixtures for the graphical tests.
+
+The example configurations are parsed once per session so the parser cost
+is not paid again by every visualization test.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from textual.funding_dsl_parser import FundingDSLParser
+
+
+@pytest.fixture(scope="session")
+def minimal_config():
+    """Parsed minimal example configuration"""
+    parser = FundingDSLParser()
+    return parser.parse_file(str(PROJECT_ROOT / "examples" / "minimal_funding.dsl"))
+
+
+@pytest.fixture(scope="session")
+def example_config():
+    """Parsed comprehensive example configuration"""
+    parser = FundingDSLParser()
+    return parser.parse_file(str(PROJECT_ROOT / "examples" / "example_funding.dsl"))
@@ -7,6 +7,9 @@ import tempfile
 import os
 import json
 import sys
+from operator import attrgetter
+
+import pytest
 
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -22,22 +25,21 @@ from metamodel.funding_metamodel import (
 
 class MockCanvas:
     """Mock canvas for testing"""
+    __slots__ = ("next_id",)
+
     def __init__(self):
-        self.items = []
         self.next_id = 1
-        
+
     def create_rectangle(self, *args, **kwargs):
         id = self.next_id
         self.next_id += 1
-        self.items.append(('rectangle', id, args, kwargs))
         return id
-        
+
     def create_text(self, *args, **kwargs):
         id = self.next_id
         self.next_id += 1
-        self.items.append(('text', id, args, kwargs))
         return id
-        
+
     def move(self, id, dx, dy):
         pass
         
@@ -48,142 +50,118 @@ class MockCanvas:
         pass
 
 
-class TestVisualElements(unittest.TestCase):
-    """Test visual element classes"""
-    
-    def setUp(self):
-        self.canvas = MockCanvas()
-        
-    def test_project_element_creation(self):
-        """Test creating a project element"""
-        element = ProjectElement(self.canvas, 100, 100)
-        element.project_name = "Test Project"
-        element.description = "A test project"
-        element.preferred_currency = CurrencyType.USD
-        
-        element.draw()
-        
-        self.assertEqual(element.x, 100)
-        self.assertEqual(element.y, 100)
-        self.assertEqual(element.project_name, "Test Project")
-        self.assertIsNotNone(element.canvas_id)
-        self.assertIsNotNone(element.text_id)
-        
-    def test_beneficiary_element_creation(self):
-        """Test creating a beneficiary element"""
-        element = BeneficiaryElement(self.canvas, 200, 200)
-        element.name = "John Doe"
-        element.email = "john@example.com"
-        element.github_username = "johndoe"
-        
-        element.draw()
-        
-        self.assertEqual(element.name, "John Doe")
-        self.assertEqual(element.email, "john@example.com")
-        self.assertEqual(element.github_username, "johndoe")
-        
-        # Test metamodel conversion
-        beneficiary = element.to_metamodel_object()
-        self.assertEqual(beneficiary.name, "John Doe")
-        self.assertEqual(beneficiary.email, "john@example.com")
-        self.assertEqual(beneficiary.github_username, "johndoe")
-        
-    def test_funding_source_element_creation(self):
-        """Test creating a funding source element"""
-        element = FundingSourceElement(self.canvas, 300, 300)
-        element.platform = FundingPlatform.GITHUB_SPONSORS
-        element.username = "testuser"
-        element.funding_type = FundingType.RECURRING
-        
-        element.draw()
-        
-        self.assertEqual(element.platform, FundingPlatform.GITHUB_SPONSORS)
-        self.assertEqual(element.username, "testuser")
-        self.assertEqual(element.funding_type, FundingType.RECURRING)
-        
-        # Test metamodel conversion
-        source = element.to_metamodel_object()
-        self.assertEqual(source.platform, FundingPlatform.GITHUB_SPONSORS)
-        self.assertEqual(source.username, "testuser")
-        self.assertEqual(source.funding_type, FundingType.RECURRING)
-        
-    def test_funding_tier_element_creation(self):
-        """Test creating a funding tier element"""
-        element = FundingTierElement(self.canvas, 400, 400)
-        element.name = "Supporter"
-        element.amount = 25.0
-        element.currency = CurrencyType.USD
-        element.description = "Monthly support"
-        element.benefits = ["Thanks", "Updates"]
-        
-        element.draw()
-        
-        self.assertEqual(element.name, "Supporter")
-        self.assertEqual(element.amount, 25.0)
-        self.assertEqual(element.currency, CurrencyType.USD)
-        
-        # Test metamodel conversion
-        tier = element.to_metamodel_object()
-        self.assertEqual(tier.name, "Supporter")
-        self.assertEqual(tier.amount.value, 25.0)
-        self.assertEqual(tier.amount.currency, CurrencyType.USD)
-        self.assertEqual(tier.benefits, ["Thanks", "Updates"])
-        
-    def test_funding_goal_element_creation(self):
-        """Test creating a funding goal element"""
-        element = FundingGoalElement(self.canvas, 500, 500)
-        element.name = "Server Costs"
-        element.target_amount = 1000.0
-        element.current_amount = 250.0
-        element.currency = CurrencyType.USD
-        
-        element.draw()
-        
-        self.assertEqual(element.name, "Server Costs")
-        self.assertEqual(element.target_amount, 1000.0)
-        self.assertEqual(element.current_amount, 250.0)
-        
-        # Test metamodel conversion
-        goal = element.to_metamodel_object()
-        self.assertEqual(goal.name, "Server Costs")
-        self.assertEqual(goal.target_amount.value, 1000.0)
-        self.assertEqual(goal.current_amount.value, 250.0)
-        self.assertEqual(goal.progress_percentage, 25.0)
-        
-    def test_element_movement(self):
-        """Test moving elements"""
-        element = BeneficiaryElement(self.canvas, 100, 100)
-        element.draw()
-        
-        original_x, original_y = element.x, element.y
-        element.move(50, 30)
-        
-        self.assertEqual(element.x, original_x + 50)
-        self.assertEqual(element.y, original_y + 30)
-        
-    def test_point_containment(self):
-        """Test point containment checking"""
-        element = BeneficiaryElement(self.canvas, 100, 100)
-        
-        # Point inside element
-        self.assertTrue(element.contains_point(150, 130))
-        
-        # Point outside element
-        self.assertFalse(element.contains_point(50, 50))
-        self.assertFalse(element.contains_point(250, 250))
-        
-    def test_selection_state(self):
-        """Test selection state management"""
-        element = BeneficiaryElement(self.canvas, 100, 100)
-        element.draw()
-        
-        self.assertFalse(element.selected)
-        
-        element.set_selected(True)
-        self.assertTrue(element.selected)
-        
-        element.set_selected(False)
-        self.assertFalse(element.selected)
+@pytest.fixture
+def canvas():
+    return MockCanvas()
+
+
+# One case per visual element type: class, position, attributes to set,
+# expected element attributes, expected metamodel object attributes
+# (dotted paths allowed, empty when no conversion is tested).
+ELEMENT_CASES = [
+    pytest.param(
+        ProjectElement, (100, 100),
+        {"project_name": "Test Project", "description": "A test project",
+         "preferred_currency": CurrencyType.USD},
+        [("x", 100), ("y", 100), ("project_name", "Test Project")],
+        [],
+        id="project"),
+    pytest.param(
+        BeneficiaryElement, (200, 200),
+        {"name": "John Doe", "email": "john@example.com",
+         "github_username": "johndoe"},
+        [("name", "John Doe"), ("email", "john@example.com"),
+         ("github_username", "johndoe")],
+        [("name", "John Doe"), ("email", "john@example.com"),
+         ("github_username", "johndoe")],
+        id="beneficiary"),
+    pytest.param(
+        FundingSourceElement, (300, 300),
+        {"platform": FundingPlatform.GITHUB_SPONSORS, "username": "testuser",
+         "funding_type": FundingType.RECURRING},
+        [("platform", FundingPlatform.GITHUB_SPONSORS), ("username", "testuser"),
+         ("funding_type", FundingType.RECURRING)],
+        [("platform", FundingPlatform.GITHUB_SPONSORS), ("username", "testuser"),
+         ("funding_type", FundingType.RECURRING)],
+        id="source"),
+    pytest.param(
+        FundingTierElement, (400, 400),
+        {"name": "Supporter", "amount": 25.0, "currency": CurrencyType.USD,
+         "description": "Monthly support", "benefits": ["Thanks", "Updates"]},
+        [("name", "Supporter"), ("amount", 25.0), ("currency", CurrencyType.USD)],
+        [("name", "Supporter"), ("amount.value", 25.0),
+         ("amount.currency", CurrencyType.USD), ("benefits", ["Thanks", "Updates"])],
+        id="tier"),
+    pytest.param(
+        FundingGoalElement, (500, 500),
+        {"name": "Server Costs", "target_amount": 1000.0,
+         "current_amount": 250.0, "currency": CurrencyType.USD},
+        [("name", "Server Costs"), ("target_amount", 1000.0),
+         ("current_amount", 250.0)],
+        [("name", "Server Costs"), ("target_amount.value", 1000.0),
+         ("current_amount.value", 250.0), ("progress_percentage", 25.0)],
+        id="goal"),
+]
+
+
+@pytest.mark.parametrize(
+    "element_cls, position, attrs, expectations, meta_expectations", ELEMENT_CASES)
+def test_element_creation(canvas, element_cls, position, attrs,
+                          expectations, meta_expectations):
+    """Test creating each visual element type and its metamodel conversion"""
+    element = element_cls(canvas, *position)
+    for attr, value in attrs.items():
+        setattr(element, attr, value)
+
+    element.draw()
+
+    assert element.canvas_id is not None
+    assert element.text_id is not None
+    for attr, expected in expectations:
+        assert attrgetter(attr)(element) == expected
+
+    if meta_expectations:
+        metamodel_object = element.to_metamodel_object()
+        for attr, expected in meta_expectations:
+            assert attrgetter(attr)(metamodel_object) == expected
+
+
+def test_element_movement(canvas):
+    """Test moving elements"""
+    element = BeneficiaryElement(canvas, 100, 100)
+    element.draw()
+
+    original_x, original_y = element.x, element.y
+    element.move(50, 30)
+
+    assert element.x == original_x + 50
+    assert element.y == original_y + 30
+
+
+def test_point_containment(canvas):
+    """Test point containment checking"""
+    element = BeneficiaryElement(canvas, 100, 100)
+
+    # Point inside element
+    assert element.contains_point(150, 130)
+
+    # Point outside element
+    assert not element.contains_point(50, 50)
+    assert not element.contains_point(250, 250)
+
+
+def test_selection_state(canvas):
+    """Test selection state management"""
+    element = BeneficiaryElement(canvas, 100, 100)
+    element.draw()
+
+    assert not element.selected
+
+    element.set_selected(True)
+    assert element.selected
+
+    element.set_selected(False)
+    assert not element.selected
 
 
 class TestModelCreation(unittest.TestCase):
@@ -270,9 +248,9 @@ class TestModelCreation(unittest.TestCase):
         self.assertEqual(platform_value, "patreon")
         self.assertEqual(type_value, "one_time")
         
-        # Test enum reconstruction
-        reconstructed_platform = FundingPlatform(platform_value)
-        reconstructed_type = FundingType(type_value)
+        # Test enum reconstruction (direct value lookup, no Enum.__call__)
+        reconstructed_platform = FundingPlatform.from_value(platform_value)
+        reconstructed_type = FundingType.from_value(type_value)
         
         self.assertEqual(reconstructed_platform, FundingPlatform.PATREON)
         self.assertEqual(reconstructed_type, FundingType.ONE_TIME)
@@ -280,4 +258,4 @@ class TestModelCreation(unittest.TestCase):
 
 if __name__ == '__main__':
     print("Testing Graphical Editor Core Functionality...")
-    unittest.main(verbosity=2)
\ No newline at end of file
+    sys.exit(pytest.main([__file__, '-v']))
\ No newline at end of file
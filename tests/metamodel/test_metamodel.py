@@ -1,73 +1,68 @@
 """
-Simple test to verify the Funding DSL metamodel works correctly
+Tests verifying the Funding DSL metamodel works correctly
 """
 
+import pytest
+
 from metamodel.funding_metamodel import (
-    FundingConfiguration, Beneficiary, FundingSource, FundingTier, 
-    FundingGoal, FundingAmount, FundingPlatform, FundingType, 
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier,
+    FundingGoal, FundingAmount, FundingPlatform, FundingType,
     CurrencyType, FundingModelValidator
 )
 
+
 def test_metamodel():
-    print("Testing Funding DSL Metamodel...")
-    
     # Test basic objects
     amount = FundingAmount(25.0, CurrencyType.USD)
-    print(f"Amount: {amount}")
-    
+    assert amount.value == 25.0
+    assert amount.currency == CurrencyType.USD
+    assert str(amount) == "25.0 USD"
+
     beneficiary = Beneficiary(
         name="John Doe",
         github_username="johndoe",
         email="john@example.com"
     )
-    print(f"Beneficiary: {beneficiary}")
-    
+    assert str(beneficiary) == "John Doe"
+
     source = FundingSource(
         platform=FundingPlatform.GITHUB_SPONSORS,
         username="johndoe",
         funding_type=FundingType.BOTH
     )
-    print(f"Source: {source}")
-    
+    assert str(source) == "github: johndoe"
+
     tier = FundingTier(
         name="Supporter",
         amount=amount,
         description="Monthly supporter",
         benefits=["Thank you note", "Early access"]
     )
-    print(f"Tier: {tier}")
-    
+    assert str(tier) == "Supporter (25.0 USD)"
+
     goal = FundingGoal(
         name="Infrastructure",
         target_amount=FundingAmount(500.0, CurrencyType.USD),
         current_amount=FundingAmount(150.0, CurrencyType.USD)
     )
-    print(f"Goal: {goal}")
-    print(f"Goal progress: {goal.progress_percentage:.1f}%")
-    
+    assert goal.progress_percentage == pytest.approx(30.0)
+
     # Test configuration
     config = FundingConfiguration(
         project_name="TestProject",
         description="A test project for funding"
     )
-    
+
     config.add_beneficiary(beneficiary)
     config.add_funding_source(source)
     config.add_tier(tier)
     config.add_goal(goal)
-    
-    print(f"\nConfiguration: {config}")
-    print(f"Active sources: {len(config.get_active_sources())}")
-    print(f"Active tiers: {len(config.get_active_tiers())}")
-    
+
+    assert len(config.get_active_sources()) == 1
+    assert len(config.get_active_tiers()) == 1
+    assert len(config.get_unreached_goals()) == 1
+
     # Test validation
     errors = FundingModelValidator.validate_configuration(config)
-    if errors:
-        print(f"\nValidation errors: {errors}")
-    else:
-        print("\n✓ Configuration is valid!")
-    
-    print("\nMetamodel test completed successfully!")
-
-if __name__ == "__main__":
-    test_metamodel() 
\ No newline at end of file
+    assert errors == []
+    assert FundingModelValidator.is_valid_configuration(config)
@@ -1,18 +1,17 @@
 """
-Simple test to debug parser issues
+Simple parser smoke test
 """
 
+from textual.funding_dsl_parser import FundingDSLParser
+
+
 def test_simple():
-    print("Starting simple test...")
-    
-    from textual.funding_dsl_parser import FundingDSLParser
-    
     # Create a simple test DSL
     simple_dsl = '''
     funding "TestProject" {
         description "A test project"
         currency USD
-        
+
         beneficiaries {
             beneficiary "John Doe" {
                 email "john@example.com"
@@ -21,22 +20,13 @@ def test_simple():
         }
     }
     '''
-    
-    print("Creating parser...")
+
     parser = FundingDSLParser()
-    
-    print("Parsing text...")
-    try:
-        config = parser.parse_text(simple_dsl)
-        print("✅ Parse successful!")
-        print(f"Project: {config.project_name}")
-        print(f"Description: {config.description}")
-        print(f"Beneficiaries: {len(config.beneficiaries)}")
-        
-    except Exception as e:
-        print(f"❌ Parse failed: {e}")
-        import traceback
-        traceback.print_exc()
+    config = parser.parse_text(simple_dsl)
 
-if __name__ == "__main__":
-    test_simple() 
\ No newline at end of file
+    assert config.project_name == "TestProject"
+    assert config.description == "A test project"
+    assert len(config.beneficiaries) == 1
+    assert config.beneficiaries[0].name == "John Doe"
+    assert config.beneficiaries[0].email == "john@example.com"
+    assert config.beneficiaries[0].github_username == "johndoe"
@@ -1,74 +1,138 @@
 #!/usr/bin/env python3
 """
 TextX Tests Runner - Runs all TextX-related tests in sequence.
+
+Tests run in-process by default so the Python interpreter startup and the
+textX import cost are only paid once for the whole suite. Pass --isolated
+to fall back to running each test file in its own subprocess.
 """
 
+import contextlib
+import importlib.util
+import io
 import sys
 import subprocess
+import unittest
 from pathlib import Path
 
-def run_test(test_file):
-    """Run a single test file and return success status"""
-    print(f"\n🧪 Running {test_file.name}...")
-    print("-" * 50)
-    
+# Add project root to path so test modules can import the packages
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+def run_test_isolated(test_file):
+    """Run a single test file in a subprocess and return success status"""
     try:
-        result = subprocess.run([sys.executable, str(test_file)], 
+        result = subprocess.run([sys.executable, str(test_file)],
                               capture_output=True, text=True, cwd=test_file.parent.parent.parent)
-        
-        if result.returncode == 0:
-            print(f"✅ {test_file.name} PASSED")
-            return True
-        else:
-            print(f"❌ {test_file.name} FAILED")
-            if result.stdout:
-                print("STDOUT:")
-                print(result.stdout)
-            if result.stderr:
-                print("STDERR:")
-                print(result.stderr)
-            return False
-            
+
+        return result.returncode == 0, result.stdout, result.stderr
+
     except Exception as e:
-        print(f"❌ Error running {test_file.name}: {e}")
-        return False
+        return False, "", f"Error running {test_file.name}: {e}"
+
+def run_test_in_process(test_file):
+    """Import a test file and run it in the current process"""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    try:
+        spec = importlib.util.spec_from_file_location(test_file.stem, test_file)
+        module = importlib.util.module_from_spec(spec)
+
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            spec.loader.exec_module(module)
+
+            if hasattr(module, 'main'):
+                # Script-style test with its own main() entry point
+                success = bool(module.main())
+            else:
+                # unittest-style test module
+                suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+                result = unittest.TextTestRunner(stream=stderr, verbosity=1).run(suite)
+                success = result.wasSuccessful()
+
+        return success, stdout.getvalue(), stderr.getvalue()
+
+    except Exception as e:
+        return False, stdout.getvalue(), f"Error running {test_file.name}: {e}"
+
+def run_test(test_file, isolated=False):
+    """Run a single test file and return success status"""
+    print(f"\n🧪 Running {test_file.name}...")
+    print("-" * 50)
+
+    if isolated:
+        success, out, err = run_test_isolated(test_file)
+    else:
+        success, out, err = run_test_in_process(test_file)
+
+    if success:
+        print(f"✅ {test_file.name} PASSED")
+    else:
+        print(f"❌ {test_file.name} FAILED")
+        if out:
+            print("STDOUT:")
+            print(out)
+        if err:
+            print("STDERR:")
+            print(err)
+
+    return success
 
 def main():
+    isolated = '--isolated' in sys.argv
+
     print("🚀 TextX Test Suite Runner")
     print("=" * 60)
-    
+
     test_dir = Path(__file__).parent
-    
+
     # Test files to run
     test_files = [
         test_dir / "test_textx_parser_fixed.py",
         test_dir / "test_roundtrip_textx.py"
     ]
-    
+
+    # Prefer pytest so independent tests can run in parallel across cores
+    # (pytest-xdist); fall back to the sequential in-process runner.
+    if not isolated:
+        try:
+            import pytest
+        except ImportError:
+            pytest = None
+
+        if pytest is not None:
+            args = [str(f) for f in test_files if f.exists()] + ['-q']
+            try:
+                import xdist  # noqa: F401
+                args += ['-n', 'auto']
+            except ImportError:
+                pass
+            return pytest.main(args) == 0
+
     results = []
-    
+
     for test_file in test_files:
         if test_file.exists():
-            success = run_test(test_file)
+            success = run_test(test_file, isolated=isolated)
             results.append((test_file.name, success))
         else:
             print(f"⚠️  Test file not found: {test_file.name}")
             results.append((test_file.name, False))
-    
+
     # Summary
     print("\n" + "=" * 60)
     print("📊 Test Summary")
     print("=" * 60)
-    
+
     passed = sum(1 for _, success in results if success)
     failed = len(results) - passed
-    
+
     for test_name, success in results:
         status = "✅ PASSED" if success else "❌ FAILED"
         print(f"  {test_name}: {status}")
-    
+
     print(f"\n📈 Results: {passed} passed, {failed} failed")
-    
+
     if failed == 0:
         print("🎉 All TextX tests PASSED!")
         return True
@@ -78,4 +142,4 @@ def main():
 
 if __name__ == "__main__":
     success = main()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(0 if success else 1)
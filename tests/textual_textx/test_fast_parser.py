@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for the hand-written fast Funding DSL parser
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from textual_textx.funding_dsl_fast_parser import (
+    FundingDSLFastParser, FastParseError, parse_funding_dsl_text_fast
+)
+from textual_textx import parse_funding_dsl_text_textx
+from metamodel.funding_metamodel import (
+    FundingPlatform, FundingType, CurrencyType
+)
+
+
+COMPLETE_DSL = '''
+funding "Fast Parser Test" {
+    description "A complete configuration"
+    currency EUR
+    min_amount 5.0
+    max_amount 1000.0
+
+    beneficiaries {
+        beneficiary "Alice Developer" {
+            email "alice@example.com"
+            github "alicedev"
+            website "https://alice.dev"
+            description "Lead maintainer"
+        }
+    }
+
+    sources {
+        github_sponsors "alicedev" {
+            type recurring
+            active true
+        }
+        custom "Own Site" {
+            url "https://alice.dev/donate"
+            type one_time
+            active false
+            config {
+                "button_color" "blue"
+                "thank_you_page" "/thanks"
+            }
+        }
+    }
+
+    tiers {
+        tier "Supporter" {
+            amount 10.0 EUR
+            description "Monthly support"
+            max_sponsors 50
+            benefits ["Badge", "Newsletter"]
+        }
+    }
+
+    goals {
+        goal "Server Costs" {
+            target 500.0 EUR
+            current 120.0 EUR
+            deadline "2026-12-31"
+            description "Yearly hosting"
+        }
+    }
+}
+'''
+
+
+class TestFastParser(unittest.TestCase):
+    """Test cases for the recursive-descent fast parser"""
+
+    def test_complete_configuration(self):
+        config = parse_funding_dsl_text_fast(COMPLETE_DSL)
+
+        self.assertEqual(config.project_name, "Fast Parser Test")
+        self.assertEqual(config.description, "A complete configuration")
+        self.assertEqual(config.preferred_currency, CurrencyType.EUR)
+        self.assertEqual(config.min_amount.value, 5.0)
+        self.assertEqual(config.max_amount.value, 1000.0)
+
+        self.assertEqual(len(config.beneficiaries), 1)
+        beneficiary = config.beneficiaries[0]
+        self.assertEqual(beneficiary.name, "Alice Developer")
+        self.assertEqual(beneficiary.github_username, "alicedev")
+
+        self.assertEqual(len(config.funding_sources), 2)
+        github, custom = config.funding_sources
+        self.assertEqual(github.platform, FundingPlatform.GITHUB_SPONSORS)
+        self.assertEqual(github.funding_type, FundingType.RECURRING)
+        self.assertTrue(github.is_active)
+        self.assertEqual(custom.platform, FundingPlatform.CUSTOM)
+        self.assertEqual(custom.custom_url, "https://alice.dev/donate")
+        self.assertFalse(custom.is_active)
+        self.assertEqual(custom.platform_specific_config,
+                         {"button_color": "blue", "thank_you_page": "/thanks"})
+
+        self.assertEqual(len(config.tiers), 1)
+        tier = config.tiers[0]
+        self.assertEqual(tier.amount.value, 10.0)
+        self.assertEqual(tier.amount.currency, CurrencyType.EUR)
+        self.assertEqual(tier.max_sponsors, 50)
+        self.assertEqual(tier.benefits, ["Badge", "Newsletter"])
+
+        self.assertEqual(len(config.goals), 1)
+        goal = config.goals[0]
+        self.assertEqual(goal.target_amount.value, 500.0)
+        self.assertEqual(goal.current_amount.value, 120.0)
+        self.assertEqual(goal.deadline.year, 2026)
+
+    def test_matches_textx_parser(self):
+        """Fast parser and textX parser must agree on the same input"""
+        fast = parse_funding_dsl_text_fast(COMPLETE_DSL)
+        textx = parse_funding_dsl_text_textx(COMPLETE_DSL)
+        self.assertEqual(fast, textx)
+
+    def test_comments_are_skipped(self):
+        """Unlike the textX grammar, the fast parser tolerates comments"""
+        config = parse_funding_dsl_text_fast('''
+        funding "Commented" {  // inline comment
+            /* block
+               comment */
+            currency GBP
+        }
+        ''')
+        self.assertEqual(config.project_name, "Commented")
+        self.assertEqual(config.preferred_currency, CurrencyType.GBP)
+
+    def test_minimal_configuration(self):
+        config = parse_funding_dsl_text_fast('funding "Minimal" {}')
+        self.assertEqual(config.project_name, "Minimal")
+        self.assertEqual(config.preferred_currency, CurrencyType.USD)
+        self.assertEqual(config.beneficiaries, [])
+        self.assertEqual(config.funding_sources, [])
+
+    def test_syntax_errors(self):
+        parser = FundingDSLFastParser()
+        for bad_dsl in (
+            'not_funding "X" {}',
+            'funding "X" {',
+            'funding "X" { bogus_keyword "y" }',
+            'funding "X" { currency XYZ }',
+            'funding "X" { tiers { tier "T" {} } }',
+        ):
+            with self.subTest(dsl=bad_dsl):
+                with self.assertRaises(FastParseError):
+                    parser.parse_text(bad_dsl)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
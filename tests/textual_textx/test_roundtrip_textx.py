@@ -4,6 +4,7 @@ Round-trip Test: TextX DSL -> Model -> GitHub YAML -> Comparison
 Tests the complete pipeline from TextX parsing to GitHub funding.yml export.
 """
 
+import functools
 import sys
 from pathlib import Path
 
@@ -13,6 +14,14 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 from textual_textx import parse_funding_dsl_file_textx
 from export.funding_exporter import FundingExporter
 
+
+@functools.cache
+def _load_reference():
+    """Read and normalize the reference funding.yml once per process"""
+    original_file = Path(__file__).parent.parent.parent / "TEST-FUNDING.yml"
+    return original_file.read_text().strip()
+
+
 def main():
     print("TextX DSL -> GitHub YAML Round-trip Test")
     print("=" * 50)
@@ -32,18 +41,16 @@ def main():
     print(generated_yaml)
     print("-" * 30)
     
-    # Read original (from project root)
-    original_file = Path(__file__).parent.parent.parent / "TEST-FUNDING.yml"
-    with open(original_file, "r") as f:
-        original_yaml = f.read()
-    
+    # Read original (from project root), already stripped at load time
+    original_yaml = _load_reference()
+
     print("\nOriginal YAML:")
     print("-" * 30)
     print(original_yaml)
     print("-" * 30)
-    
+
     # Compare
-    match = generated_yaml.strip() == original_yaml.strip()
+    match = generated_yaml.strip() == original_yaml
     print(f"\nComparison Result: {'PERFECT MATCH!' if match else 'DIFFERENCES FOUND'}")
     
     if match:
@@ -56,6 +63,12 @@ def main():
     
     return match
 
+
+def test_roundtrip_textx():
+    """Pytest entry point so the round-trip runs under pytest/pytest-xdist"""
+    assert main()
+
+
 if __name__ == "__main__":
     success = main()
     sys.exit(0 if success else 1) 
\ No newline at end of file
@@ -5,6 +5,7 @@ Comprehensive tests for TextX-based Funding DSL Parser (Fixed Version)
 
 import unittest
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -23,10 +24,59 @@ from metamodel.funding_metamodel import (
 
 class TestTextXParser(unittest.TestCase):
     """Test cases for TextX parser functionality"""
+
+    # Parametric DSL fragments are built once at class-definition time so
+    # the loops below only pay for the parse itself
+    _CURRENCY_DSL = tuple(
+        (currency, f'''
+        funding "Currency Test" {{
+            currency {currency}
+        }}
+        ''')
+        for currency in ('USD', 'EUR', 'GBP', 'CAD', 'AUD'))
+
+    _PLATFORM_DSL = tuple(
+        (platform, f'''
+        funding "Platform Test" {{
+            currency USD
+            sources {{
+                {platform} "testuser" {{
+                    type both
+                    active true
+                }}
+            }}
+        }}
+        ''')
+        for platform in (
+            'github_sponsors', 'patreon', 'ko_fi', 'open_collective',
+            'buy_me_a_coffee', 'liberapay', 'paypal', 'tidelift',
+            'issuehunt', 'community_bridge', 'polar', 'thanks_dev'))
+
+    _FUNDING_TYPE_DSL = tuple(
+        (funding_type, f'''
+        funding "Funding Type Test" {{
+            currency USD
+            sources {{
+                github_sponsors "testuser" {{
+                    type {funding_type}
+                    active true
+                }}
+            }}
+        }}
+        ''')
+        for funding_type in ('one_time', 'recurring', 'both'))
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.parser = FundingDSLTextXParser()
+    @classmethod
+    def setUpClass(cls):
+        """Build the parser once for the whole class; the underlying textX
+        metamodel is itself cached across parser instances"""
+        cls.parser = FundingDSLTextXParser()
+
+    def test_shared_metamodel(self):
+        """The grammar is compiled once and shared across parser instances"""
+        self.assertIs(self.parser.metamodel,
+                      FundingDSLTextXParser._shared_metamodel)
+        self.assertIs(FundingDSLTextXParser().metamodel, self.parser.metamodel)
     
     def test_minimal_configuration(self):
         """Test parsing minimal configuration"""
@@ -200,64 +250,32 @@ class TestTextXParser(unittest.TestCase):
     
     def test_currency_types(self):
         """Test all supported currency types"""
-        currencies = ['USD', 'EUR', 'GBP', 'CAD', 'AUD']
-        
-        for currency in currencies:
-            dsl = f'''
-            funding "Currency Test" {{
-                currency {currency}
-            }}
-            '''
-            
+        for currency, dsl in self._CURRENCY_DSL:
             config = parse_funding_dsl_text_textx(dsl)
             expected_currency = getattr(CurrencyType, currency)
             self.assertEqual(config.preferred_currency, expected_currency)
     
     def test_platform_types(self):
         """Test all supported platform types"""
-        platforms = [
-            'github_sponsors', 'patreon', 'ko_fi', 'open_collective',
-            'buy_me_a_coffee', 'liberapay', 'paypal', 'tidelift',
-            'issuehunt', 'community_bridge', 'polar', 'thanks_dev'
-        ]
-        
-        for platform in platforms:
-            dsl = f'''
-            funding "Platform Test" {{
-                currency USD
-                sources {{
-                    {platform} "testuser" {{
-                        type both
-                        active true
-                    }}
-                }}
-            }}
-            '''
-            
-            config = parse_funding_dsl_text_textx(dsl)
-            self.assertEqual(len(config.funding_sources), 1)
-            
-            source = config.funding_sources[0]
-            expected_platform = getattr(FundingPlatform, platform.upper())
-            self.assertEqual(source.platform, expected_platform)
+        # The 12 parses are independent, so run them on a small thread pool
+        # (the shared metamodel is built once under a lock) and assert on
+        # the main thread where subTest reporting works
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            configs = list(executor.map(
+                parse_funding_dsl_text_textx,
+                (dsl for _, dsl in self._PLATFORM_DSL)))
+
+        for (platform, _), config in zip(self._PLATFORM_DSL, configs):
+            with self.subTest(platform=platform):
+                self.assertEqual(len(config.funding_sources), 1)
+
+                source = config.funding_sources[0]
+                expected_platform = getattr(FundingPlatform, platform.upper())
+                self.assertEqual(source.platform, expected_platform)
     
     def test_funding_types(self):
         """Test all supported funding types"""
-        funding_types = ['one_time', 'recurring', 'both']
-        
-        for funding_type in funding_types:
-            dsl = f'''
-            funding "Funding Type Test" {{
-                currency USD
-                sources {{
-                    github_sponsors "testuser" {{
-                        type {funding_type}
-                        active true
-                    }}
-                }}
-            }}
-            '''
-            
+        for funding_type, dsl in self._FUNDING_TYPE_DSL:
             config = parse_funding_dsl_text_textx(dsl)
             source = config.funding_sources[0]
             expected_type = getattr(FundingType, funding_type.upper())
@@ -4,14 +4,23 @@ Step 2 Demonstration - Textual Syntax and Parser
 Shows the complete functionality of the Funding DSL parser.
 """
 
+import sys
+
+
 def demonstrate_step2():
-    print("🚀 Funding DSL - Step 2 Demonstration")
-    print("=" * 50)
-    
+    # Collect all demo output in a list and emit it with a single
+    # sys.stdout.write at the end: one syscall instead of one flush (and
+    # stdout lock acquisition) per print call
+    buf = []
+    out = buf.append
+
+    out("🚀 Funding DSL - Step 2 Demonstration")
+    out("=" * 50)
+
     # Import our modules
     from textual.funding_dsl_parser import FundingDSLParser
     from metamodel.funding_metamodel import FundingModelValidator
-    
+
     # Create a sample DSL configuration
     sample_dsl = '''
     // Sample Funding Configuration
@@ -71,71 +80,77 @@ def demonstrate_step2():
     }
     '''
     
-    print("📝 Sample DSL Configuration:")
-    print("-" * 30)
-    print(sample_dsl.strip())
-    print()
-    
-    print("🔧 Parsing DSL...")
+    out("📝 Sample DSL Configuration:")
+    out("-" * 30)
+    out(sample_dsl.strip())
+    out("")
+
+    out("🔧 Parsing DSL...")
     parser = FundingDSLParser()
     config = parser.parse_text(sample_dsl)
-    print("✅ Parsing successful!")
-    print()
-    
-    print("📊 Parsed Configuration:")
-    print("-" * 30)
-    print(f"Project: {config.project_name}")
-    print(f"Description: {config.description}")
-    print(f"Currency: {config.preferred_currency.value}")
-    print(f"Amount range: {config.min_amount} - {config.max_amount}")
-    print()
-    
-    print(f"👥 Beneficiaries ({len(config.beneficiaries)}):")
-    for ben in config.beneficiaries:
-        print(f"  • {ben.name} (@{ben.github_username})")
-        print(f"    {ben.description}")
-    print()
-    
-    print(f"💰 Funding Sources ({len(config.funding_sources)}):")
-    for source in config.funding_sources:
-        print(f"  • {source.platform.value}: {source.username}")
-        print(f"    Type: {source.funding_type.value}, Active: {source.is_active}")
-    print()
-    
-    print(f"🎯 Sponsorship Tiers ({len(config.tiers)}):")
-    for tier in config.tiers:
-        print(f"  • {tier.name}: {tier.amount}")
-        print(f"    {tier.description}")
-        print(f"    Benefits: {len(tier.benefits)} items")
-    print()
-    
-    print(f"📈 Funding Goals ({len(config.goals)}):")
-    for goal in config.goals:
-        print(f"  • {goal.name}: {goal.current_amount}/{goal.target_amount}")
-        print(f"    Progress: {goal.progress_percentage:.1f}%")
-        print(f"    {goal.description}")
-    print()
-    
-    print("✅ Validation:")
+    out("✅ Parsing successful!")
+    out("")
+
+    out("📊 Parsed Configuration:")
+    out("-" * 30)
+    out(f"Project: {config.project_name}")
+    out(f"Description: {config.description}")
+    out(f"Currency: {config.preferred_currency.value}")
+    out(f"Amount range: {config.min_amount} - {config.max_amount}")
+    out("")
+
+    # Collection sections render via str.join over generator expressions,
+    # keeping the per-element work in C-level join/format paths
+    out(f"👥 Beneficiaries ({len(config.beneficiaries)}):")
+    out("\n".join(
+        f"  • {ben.name} (@{ben.github_username})\n    {ben.description}"
+        for ben in config.beneficiaries))
+    out("")
+
+    out(f"💰 Funding Sources ({len(config.funding_sources)}):")
+    out("\n".join(
+        f"  • {source.platform.value}: {source.username}"
+        f"\n    Type: {source.funding_type.value}, Active: {source.is_active}"
+        for source in config.funding_sources))
+    out("")
+
+    out(f"🎯 Sponsorship Tiers ({len(config.tiers)}):")
+    out("\n".join(
+        f"  • {tier.name}: {tier.amount}\n    {tier.description}"
+        f"\n    Benefits: {len(tier.benefits)} items"
+        for tier in config.tiers))
+    out("")
+
+    out(f"📈 Funding Goals ({len(config.goals)}):")
+    out("\n".join(
+        f"  • {goal.name}: {goal.current_amount}/{goal.target_amount}"
+        f"\n    Progress: {goal.progress_percentage:.1f}%\n    {goal.description}"
+        for goal in config.goals))
+    out("")
+
+    out("✅ Validation:")
     errors = FundingModelValidator.validate_configuration(config)
     if errors:
-        print("❌ Validation errors found:")
+        out("❌ Validation errors found:")
         for error in errors:
-            print(f"  - {error}")
+            out(f"  - {error}")
     else:
-        print("✅ Configuration is completely valid!")
-    print()
-    
-    print("🎉 Step 2 Features Demonstrated:")
-    print("  ✅ User-friendly textual syntax")
-    print("  ✅ Complete ANTLR grammar")
-    print("  ✅ Robust Python parser")
-    print("  ✅ Seamless metamodel integration")
-    print("  ✅ Error handling and validation")
-    print("  ✅ Support for all funding features")
-    print()
-    
-    print("🔄 Ready for Step 3: Graphical notation and modeling environment!")
+        out("✅ Configuration is completely valid!")
+    out("")
+
+    out("🎉 Step 2 Features Demonstrated:")
+    out("  ✅ User-friendly textual syntax")
+    out("  ✅ Complete ANTLR grammar")
+    out("  ✅ Robust Python parser")
+    out("  ✅ Seamless metamodel integration")
+    out("  ✅ Error handling and validation")
+    out("  ✅ Support for all funding features")
+    out("")
+
+    out("🔄 Ready for Step 3: Graphical notation and modeling environment!")
+
+    sys.stdout.write("\n".join(buf) + "\n")
+
 
 if __name__ == "__main__":
-    demonstrate_step2() 
\ No newline at end of file
+    demonstrate_step2()
@@ -4,6 +4,17 @@ Uses simplified parsing (would use ANTLR-generated parser in production).
 """
 
 import re
+
+try:
+    # Optional engine swap: google-re2 matches in guaranteed linear time,
+    # which hardens the parser against pathological inputs and is faster
+    # on the non-greedy patterns below. The stdlib engine is the fallback
+    # and supports the identical (backreference-free) syntax used here.
+    import re2 as _re
+except ImportError:
+    _re = re
+
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -19,45 +30,88 @@ class ParseError(Exception):
     pass
 
 
+# Patterns with a fixed shape are compiled once at import time; per-property
+# patterns are compiled on first use into the caches below so repeated parses
+# skip the re module's pattern-cache hashing entirely
+# One pass strips both comment styles; quoted strings are matched first so
+# a '//' inside a string literal (e.g. an https URL) is left alone
+_COMMENTS = _re.compile(r'("[^"\n]*")|//[^\n]*|/\*.*?\*/', re.DOTALL)
+_FUNDING_HEADER = _re.compile(r'funding\s+"([^"]+)"\s*\{')
+_BENEFICIARY_HEADER = _re.compile(r'beneficiary\s+"([^"]+)"\s*\{')
+_TIER_HEADER = _re.compile(r'tier\s+"([^"]+)"\s*\{')
+_GOAL_HEADER = _re.compile(r'goal\s+"([^"]+)"\s*\{')
+_AMOUNT = _re.compile(r'amount\s+([\d.]+)\s+([A-Z]+)')
+_TARGET = _re.compile(r'target\s+([\d.]+)\s+([A-Z]+)')
+_CURRENT = _re.compile(r'current\s+([\d.]+)\s+([A-Z]+)')
+_CONFIG_HDR = _re.compile(r'\bconfig\s*\{')
+_BRACE = _re.compile(r'[{}]')
+_PROPS_STR = _re.compile(r'([A-Za-z_]+)\s+"([^"]+)"')
+_STRING_ITEM = _re.compile(r'"([^"]+)"')
+
+_STRING_PROP_PATTERNS: Dict[str, re.Pattern] = {}
+_KEYWORD_PROP_PATTERNS: Dict[str, re.Pattern] = {}
+_NUMBER_PROP_PATTERNS: Dict[str, re.Pattern] = {}
+_BOOLEAN_PROP_PATTERNS: Dict[str, re.Pattern] = {}
+_LIST_PROP_PATTERNS: Dict[str, re.Pattern] = {}
+_BLOCK_PATTERNS: Dict[str, re.Pattern] = {}
+
+
+def _cached_pattern(cache: Dict[str, re.Pattern], name: str, template: str) -> re.Pattern:
+    """Get the compiled pattern for a property name, compiling it once"""
+    pattern = cache.get(name)
+    if pattern is None:
+        pattern = cache.setdefault(name, _re.compile(template.format(name=name)))
+    return pattern
+
+
 class FundingDSLParser:
     """Parser that converts DSL text to metamodel objects"""
     
-    def __init__(self):
-        self.platform_mapping = {
-            'github_sponsors': FundingPlatform.GITHUB_SPONSORS,
-            'patreon': FundingPlatform.PATREON,
-            'ko_fi': FundingPlatform.KO_FI,
-            'open_collective': FundingPlatform.OPEN_COLLECTIVE,
-            'buy_me_a_coffee': FundingPlatform.BUY_ME_A_COFFEE,
-            'liberapay': FundingPlatform.LIBERAPAY,
-            'paypal': FundingPlatform.PAYPAL,
-            'tidelift': FundingPlatform.TIDELIFT,
-            'issuehunt': FundingPlatform.ISSUEHUNT,
-            'community_bridge': FundingPlatform.COMMUNITY_BRIDGE,
-            'polar': FundingPlatform.POLAR,
-            'thanks_dev': FundingPlatform.THANKS_DEV,
-            'custom': FundingPlatform.CUSTOM
-        }
-        
-        self.funding_type_mapping = {
-            'one_time': FundingType.ONE_TIME,
-            'recurring': FundingType.RECURRING,
-            'both': FundingType.BOTH
-        }
-        
-        self.currency_mapping = {
-            'USD': CurrencyType.USD,
-            'EUR': CurrencyType.EUR,
-            'GBP': CurrencyType.GBP,
-            'CAD': CurrencyType.CAD,
-            'AUD': CurrencyType.AUD
-        }
+    # Keyword-to-enum tables are immutable shared state: built once at
+    # class-definition time and frozen, so instantiation allocates nothing
+    platform_mapping = MappingProxyType({
+        'github_sponsors': FundingPlatform.GITHUB_SPONSORS,
+        'patreon': FundingPlatform.PATREON,
+        'ko_fi': FundingPlatform.KO_FI,
+        'open_collective': FundingPlatform.OPEN_COLLECTIVE,
+        'buy_me_a_coffee': FundingPlatform.BUY_ME_A_COFFEE,
+        'liberapay': FundingPlatform.LIBERAPAY,
+        'paypal': FundingPlatform.PAYPAL,
+        'tidelift': FundingPlatform.TIDELIFT,
+        'issuehunt': FundingPlatform.ISSUEHUNT,
+        'community_bridge': FundingPlatform.COMMUNITY_BRIDGE,
+        'polar': FundingPlatform.POLAR,
+        'thanks_dev': FundingPlatform.THANKS_DEV,
+        'custom': FundingPlatform.CUSTOM
+    })
+    
+    funding_type_mapping = MappingProxyType({
+        'one_time': FundingType.ONE_TIME,
+        'recurring': FundingType.RECURRING,
+        'both': FundingType.BOTH
+    })
+    
+    currency_mapping = MappingProxyType({
+        'USD': CurrencyType.USD,
+        'EUR': CurrencyType.EUR,
+        'GBP': CurrencyType.GBP,
+        'CAD': CurrencyType.CAD,
+        'AUD': CurrencyType.AUD
+    })
+    
+    # One alternation pattern matches every platform's source header,
+    # so a sources block is scanned once instead of once per platform
+    _source_header = _re.compile(
+        r'(' + '|'.join(map(re.escape, platform_mapping)) +
+        r')\s+"([^"]+)"\s*\{')
     
     def parse_file(self, file_path: str) -> FundingConfiguration:
         """Parse a .funding file and return a FundingConfiguration object"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read raw bytes and decode in one shot; this skips the text
+            # wrapper's incremental decoding and newline translation
+            with open(file_path, 'rb') as f:
+                content = f.read().decode('utf-8')
             return self.parse_text(content)
         except FileNotFoundError:
             raise ParseError(f"File not found: {file_path}")
@@ -75,12 +129,11 @@ class FundingDSLParser:
     def _simple_parse(self, text: str) -> Dict[str, Any]:
         """Simple parser for demonstration - would be replaced by ANTLR parser"""
         
-        # Remove comments
-        text = re.sub(r'//.*?$', '', text, flags=re.MULTILINE)
-        text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+        # Remove comments in a single pass, keeping quoted strings intact
+        text = _COMMENTS.sub(lambda m: m.group(1) or '', text)
         
         # Extract project name
-        funding_match = re.search(r'funding\s+"([^"]+)"\s*\{', text)
+        funding_match = _FUNDING_HEADER.search(text)
         if not funding_match:
             raise ParseError("No funding block found")
         
@@ -92,377 +145,426 @@ class FundingDSLParser:
         min_amount = self._extract_number_property(text, 'min_amount')
         max_amount = self._extract_number_property(text, 'max_amount')
         
-        # Extract blocks
-        beneficiaries = self._extract_beneficiaries(text)
-        sources = self._extract_sources(text)
-        tiers = self._extract_tiers(text)
-        goals = self._extract_goals(text)
+        # One sweep over the text pairs every brace; the block extractors
+        # then find any matching brace with a dict lookup
+        match_of = self._build_brace_map(text)
         
+        # Blocks are exposed as lazy iterators; _build_configuration
+        # consumes each exactly once, so no intermediate lists are built
         return {
             'project_name': project_name,
             'description': description,
             'currency': currency,
             'min_amount': min_amount,
             'max_amount': max_amount,
-            'beneficiaries': beneficiaries,
-            'sources': sources,
-            'tiers': tiers,
-            'goals': goals
+            'beneficiaries': self._iter_beneficiaries(text, match_of),
+            'sources': self._iter_sources(text, match_of),
+            'tiers': self._iter_tiers(text, match_of),
+            'goals': self._iter_goals(text, match_of)
         }
     
+    def _collect_props(self, text: str) -> Dict[str, str]:
+        """Collect all string properties of a block in a single sweep"""
+        return dict(_PROPS_STR.findall(text))
+    
     def _extract_string_property(self, text: str, property_name: str) -> Optional[str]:
         """Extract a string property value"""
-        pattern = rf'{property_name}\s+"([^"]+)"'
-        match = re.search(pattern, text)
+        pattern = _cached_pattern(
+            _STRING_PROP_PATTERNS, property_name, r'{name}\s+"([^"]+)"')
+        match = pattern.search(text)
         return match.group(1) if match else None
     
     def _extract_keyword_property(self, text: str, property_name: str) -> Optional[str]:
         """Extract a keyword property value"""
-        pattern = rf'{property_name}\s+([A-Z]+)'
-        match = re.search(pattern, text)
+        pattern = _cached_pattern(
+            _KEYWORD_PROP_PATTERNS, property_name, r'{name}\s+([A-Z]+)')
+        match = pattern.search(text)
         return match.group(1) if match else None
     
     def _extract_number_property(self, text: str, property_name: str) -> Optional[float]:
         """Extract a numeric property value"""
-        pattern = rf'{property_name}\s+([\d.]+)'
-        match = re.search(pattern, text)
+        pattern = _cached_pattern(
+            _NUMBER_PROP_PATTERNS, property_name, r'{name}\s+([\d.]+)')
+        match = pattern.search(text)
         return float(match.group(1)) if match else None
     
-    def _extract_balanced_block(self, text: str, block_name: str) -> Optional[str]:
-        """Extract a block with balanced braces"""
-        pattern = rf'{block_name}\s*\{{'
-        match = re.search(pattern, text)
+    def _build_brace_map(self, text: str) -> Dict[int, int]:
+        """Map each opening brace position to its matching closing brace"""
+        match_of: Dict[int, int] = {}
+        stack: List[int] = []
+        for match in _BRACE.finditer(text):
+            if match.group() == '{':
+                stack.append(match.start())
+            elif stack:
+                match_of[stack.pop()] = match.start()
+        return match_of
+    
+    def _block_span(self, text: str, match_of: Dict[int, int],
+                    block_name: str) -> Optional[tuple]:
+        """Locate a named block and return the (start, end) of its body"""
+        pattern = _cached_pattern(_BLOCK_PATTERNS, block_name, r'{name}\s*\{{')
+        match = pattern.search(text)
         if not match:
             return None
         
-        start_pos = match.end() - 1  # Position of opening brace
-        return self._extract_balanced_content(text, start_pos)
-    
-    def _extract_balanced_content(self, text: str, start_pos: int) -> str:
-        """Extract content between balanced braces starting at start_pos"""
-        if start_pos >= len(text) or text[start_pos] != '{':
-            return ""
-        
-        brace_count = 0
-        pos = start_pos
-        
-        while pos < len(text):
-            if text[pos] == '{':
-                brace_count += 1
-            elif text[pos] == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    return text[start_pos + 1:pos]  # Content between braces
-            pos += 1
-        
-        return ""  # Unbalanced braces
+        open_pos = match.end() - 1  # Position of opening brace
+        close_pos = match_of.get(open_pos)
+        if close_pos is None:
+            return None  # Unbalanced braces
+        return open_pos + 1, close_pos
     
-    def _extract_beneficiaries(self, text: str) -> List[Dict[str, Any]]:
-        """Extract beneficiaries block"""
-        beneficiaries = []
+    def _iter_beneficiaries(self, text: str, match_of: Dict[int, int]):
+        """Yield the beneficiaries block's entries one at a time"""
+        # str.__contains__ bails out instantly when the block is absent
+        if 'beneficiaries' not in text:
+            return
         
-        # Find beneficiaries block using balanced braces
-        beneficiaries_text = self._extract_balanced_block(text, 'beneficiaries')
-        if not beneficiaries_text:
-            return beneficiaries
+        span = self._block_span(text, match_of, 'beneficiaries')
+        if not span:
+            return
+        pos, end = span
         
         # Find individual beneficiaries
-        beneficiary_pattern = r'beneficiary\s+"([^"]+)"\s*\{'
-        pos = 0
         while True:
-            match = re.search(beneficiary_pattern, beneficiaries_text[pos:])
+            # Search from pos directly so no substring is copied per iteration
+            match = _BENEFICIARY_HEADER.search(text, pos, end)
             if not match:
                 break
             
             name = match.group(1)
-            start_pos = pos + match.end() - 1  # Position of opening brace
-            props_text = self._extract_balanced_content(beneficiaries_text, start_pos)
+            open_pos = match.end() - 1  # Position of opening brace
+            close_pos = match_of.get(open_pos, open_pos)
+            props_text = text[open_pos + 1:close_pos]
             
+            # Harvest every string property in one sweep instead of one
+            # regex scan per property name
+            props = self._collect_props(props_text)
             beneficiary = {
                 'name': name,
-                'email': self._extract_string_property(props_text, 'email'),
-                'github': self._extract_string_property(props_text, 'github'),
-                'website': self._extract_string_property(props_text, 'website'),
-                'description': self._extract_string_property(props_text, 'description')
+                'email': props.get('email'),
+                'github': props.get('github'),
+                'website': props.get('website'),
+                'description': props.get('description')
             }
-            beneficiaries.append(beneficiary)
+            yield beneficiary
             
-            pos = start_pos + len(props_text) + 2  # Move past this beneficiary
-        
-        return beneficiaries
+            pos = close_pos + 1  # Move past this beneficiary
     
-    def _extract_sources(self, text: str) -> List[Dict[str, Any]]:
-        """Extract sources block"""
-        sources = []
-        
-        # Find sources block using balanced braces
-        sources_text = self._extract_balanced_block(text, 'sources')
-        if not sources_text:
-            return sources
-        
-        # Find all sources (platform and custom)
-        all_platforms = ['github_sponsors', 'patreon', 'ko_fi', 'open_collective', 'buy_me_a_coffee', 'liberapay', 'paypal', 'tidelift', 'issuehunt', 'community_bridge', 'polar', 'thanks_dev', 'custom']
-        
-        for platform in all_platforms:
-            pattern = rf'{platform}\s+"([^"]+)"\s*\{{'
-            pos = 0
-            while True:
-                match = re.search(pattern, sources_text[pos:])
-                if not match:
-                    break
-                
-                username = match.group(1)
-                start_pos = pos + match.end() - 1  # Position of opening brace
-                props_text = self._extract_balanced_content(sources_text, start_pos)
-                
-                source = {
-                    'platform': platform,
-                    'username': username,
-                    'type': self._extract_keyword_property(props_text, 'type'),
-                    'active': self._extract_boolean_property(props_text, 'active'),
-                    'config': self._extract_config_block(props_text)
-                }
-                
-                if platform == 'custom':
-                    source['url'] = self._extract_string_property(props_text, 'url')
-                
-                sources.append(source)
-                pos = start_pos + len(props_text) + 2  # Move past this source
-        
-        return sources
+    def _iter_sources(self, text: str, match_of: Dict[int, int]):
+        """Yield the sources block's entries one at a time"""
+        # str.__contains__ bails out instantly when the block is absent
+        if 'sources' not in text:
+            return
+        
+        span = self._block_span(text, match_of, 'sources')
+        if not span:
+            return
+        pos, end = span
+        
+        # Find all sources (platform and custom) in document order
+        while True:
+            match = self._source_header.search(text, pos, end)
+            if not match:
+                break
+            
+            platform = match.group(1)
+            username = match.group(2)
+            open_pos = match.end() - 1  # Position of opening brace
+            close_pos = match_of.get(open_pos, open_pos)
+            props_text = text[open_pos + 1:close_pos]
+            
+            source = {
+                'platform': platform,
+                'username': username,
+                'type': self._extract_keyword_property(props_text, 'type'),
+                'active': self._extract_boolean_property(props_text, 'active'),
+                'config': self._extract_config_block(
+                    text, match_of, open_pos + 1, close_pos)
+            }
+            
+            if platform == 'custom':
+                source['url'] = self._extract_string_property(props_text, 'url')
+            
+            yield source
+            pos = close_pos + 1  # Move past this source
     
     def _extract_boolean_property(self, text: str, property_name: str) -> Optional[bool]:
         """Extract a boolean property value"""
-        pattern = rf'{property_name}\s+(true|false)'
-        match = re.search(pattern, text)
+        pattern = _cached_pattern(
+            _BOOLEAN_PROP_PATTERNS, property_name, r'{name}\s+(true|false)')
+        match = pattern.search(text)
         if match:
             return match.group(1) == 'true'
         return None
     
-    def _extract_config_block(self, text: str) -> Dict[str, str]:
-        """Extract config block as key-value pairs"""
+    def _extract_config_block(self, text: str, match_of: Dict[int, int],
+                              pos: int, end: int) -> Dict[str, str]:
+        """Extract a source's config block as key-value pairs"""
         config = {}
-        config_match = re.search(r'config\s*\{(.*?)\}', text, re.DOTALL)
+        if text.find('config', pos, end) == -1:
+            return config
+        config_match = _CONFIG_HDR.search(text, pos, end)
         if config_match:
-            config_text = config_match.group(1)
-            # Extract key-value pairs
-            kv_pattern = r'"([^"]+)"\s+"([^"]+)"'
-            for match in re.finditer(kv_pattern, config_text):
-                key = match.group(1)
-                value = match.group(2)
-                config[key] = value
+            # The brace map already knows where the block closes, so no
+            # DOTALL scan is needed (and nested braces cannot confuse it)
+            open_pos = config_match.end() - 1
+            close_pos = match_of.get(open_pos, open_pos)
+            # Configs are "key" "value" pairs, so plain string splitting
+            # covers them without any regex work: the quoted fields land at
+            # the odd indices of split('"'), alternating key and value
+            parts = text[open_pos + 1:close_pos].split('"')
+            for i in range(1, len(parts) - 2, 4):
+                if parts[i] and parts[i + 2]:
+                    config[parts[i]] = parts[i + 2]
         return config
     
-    def _extract_tiers(self, text: str) -> List[Dict[str, Any]]:
-        """Extract tiers block"""
-        tiers = []
+    def _iter_tiers(self, text: str, match_of: Dict[int, int]):
+        """Yield the tiers block's entries one at a time"""
+        # str.__contains__ bails out instantly when the block is absent
+        if 'tiers' not in text:
+            return
         
-        # Find tiers block using balanced braces
-        tiers_text = self._extract_balanced_block(text, 'tiers')
-        if not tiers_text:
-            return tiers
+        span = self._block_span(text, match_of, 'tiers')
+        if not span:
+            return
+        pos, end = span
         
         # Find individual tiers
-        tier_pattern = r'tier\s+"([^"]+)"\s*\{'
-        pos = 0
         while True:
-            match = re.search(tier_pattern, tiers_text[pos:])
+            match = _TIER_HEADER.search(text, pos, end)
             if not match:
                 break
             
             name = match.group(1)
-            start_pos = pos + match.end() - 1  # Position of opening brace
-            props_text = self._extract_balanced_content(tiers_text, start_pos)
+            open_pos = match.end() - 1  # Position of opening brace
+            close_pos = match_of.get(open_pos, open_pos)
+            props_text = text[open_pos + 1:close_pos]
             
             # Extract amount
-            amount_match = re.search(r'amount\s+([\d.]+)\s+([A-Z]+)', props_text)
+            amount_match = _AMOUNT.search(props_text)
             amount_value = float(amount_match.group(1)) if amount_match else 0.0
             amount_currency = amount_match.group(2) if amount_match else 'USD'
             
+            props = self._collect_props(props_text)
             tier = {
                 'name': name,
                 'amount': {'value': amount_value, 'currency': amount_currency},
-                'description': self._extract_string_property(props_text, 'description'),
+                'description': props.get('description'),
                 'max_sponsors': self._extract_number_property(props_text, 'max_sponsors'),
                 'benefits': self._extract_string_list(props_text, 'benefits')
             }
-            tiers.append(tier)
+            yield tier
             
-            pos = start_pos + len(props_text) + 2  # Move past this tier
-        
-        return tiers
+            pos = close_pos + 1  # Move past this tier
     
-    def _extract_goals(self, text: str) -> List[Dict[str, Any]]:
-        """Extract goals block"""
-        goals = []
+    def _iter_goals(self, text: str, match_of: Dict[int, int]):
+        """Yield the goals block's entries one at a time"""
+        # str.__contains__ bails out instantly when the block is absent
+        if 'goals' not in text:
+            return
         
-        # Find goals block using balanced braces
-        goals_text = self._extract_balanced_block(text, 'goals')
-        if not goals_text:
-            return goals
+        span = self._block_span(text, match_of, 'goals')
+        if not span:
+            return
+        pos, end = span
         
         # Find individual goals
-        goal_pattern = r'goal\s+"([^"]+)"\s*\{'
-        pos = 0
         while True:
-            match = re.search(goal_pattern, goals_text[pos:])
+            match = _GOAL_HEADER.search(text, pos, end)
             if not match:
                 break
             
             name = match.group(1)
-            start_pos = pos + match.end() - 1  # Position of opening brace
-            props_text = self._extract_balanced_content(goals_text, start_pos)
+            open_pos = match.end() - 1  # Position of opening brace
+            close_pos = match_of.get(open_pos, open_pos)
+            props_text = text[open_pos + 1:close_pos]
             
             # Extract target amount
-            target_match = re.search(r'target\s+([\d.]+)\s+([A-Z]+)', props_text)
+            target_match = _TARGET.search(props_text)
             target_value = float(target_match.group(1)) if target_match else 0.0
             target_currency = target_match.group(2) if target_match else 'USD'
             
             # Extract current amount
-            current_match = re.search(r'current\s+([\d.]+)\s+([A-Z]+)', props_text)
+            current_match = _CURRENT.search(props_text)
             current_value = float(current_match.group(1)) if current_match else 0.0
             current_currency = current_match.group(2) if current_match else 'USD'
             
+            props = self._collect_props(props_text)
             goal = {
                 'name': name,
                 'target_amount': {'value': target_value, 'currency': target_currency},
                 'current_amount': {'value': current_value, 'currency': current_currency},
-                'description': self._extract_string_property(props_text, 'description'),
-                'deadline': self._extract_string_property(props_text, 'deadline')
+                'description': props.get('description'),
+                'deadline': props.get('deadline')
             }
-            goals.append(goal)
+            yield goal
             
-            pos = start_pos + len(props_text) + 2  # Move past this goal
-        
-        return goals
+            pos = close_pos + 1  # Move past this goal
     
     def _extract_string_list(self, text: str, property_name: str) -> List[str]:
         """Extract a string list property"""
-        pattern = rf'{property_name}\s*\[(.*?)\]'
-        match = re.search(pattern, text, re.DOTALL)
+        # (?s:...) keeps the DOTALL behaviour of the baseline so the
+        # capture crosses newlines in multi-line benefit lists
+        pattern = _cached_pattern(
+            _LIST_PROP_PATTERNS, property_name, r'{name}\s*\[(?s:(.*?))\]')
+        match = pattern.search(text)
         if not match:
             return []
         
         list_text = match.group(1)
         # Extract quoted strings
-        string_pattern = r'"([^"]+)"'
-        return [m.group(1) for m in re.finditer(string_pattern, list_text)]
+        return [m.group(1) for m in _STRING_ITEM.finditer(list_text)]
     
     def _build_configuration(self, config_data: Dict[str, Any]) -> FundingConfiguration:
         """Build FundingConfiguration object from parsed data"""
         
-        # Create the main configuration
+        # Resolve the default currency once; every amount below reuses it
+        preferred_currency = self.currency_mapping.get(
+            config_data.get('currency', 'USD'), CurrencyType.USD
+        )
+        
+        # Build the four collections up front and hand them to the
+        # constructor, avoiding one add_* method call per item
         config = FundingConfiguration(
             project_name=config_data['project_name'],
             description=config_data.get('description'),
-            preferred_currency=self.currency_mapping.get(
-                config_data.get('currency', 'USD'), CurrencyType.USD
-            )
+            preferred_currency=preferred_currency,
+            beneficiaries=[
+                Beneficiary(
+                    name=ben_data['name'],
+                    email=ben_data.get('email'),
+                    github_username=ben_data.get('github'),
+                    website=ben_data.get('website'),
+                    description=ben_data.get('description')
+                )
+                for ben_data in config_data.get('beneficiaries', [])
+            ],
+            funding_sources=[
+                self._build_source(source_data)
+                for source_data in config_data.get('sources', [])
+            ],
+            tiers=[
+                self._build_tier(tier_data)
+                for tier_data in config_data.get('tiers', [])
+            ],
+            goals=[
+                self._build_goal(goal_data)
+                for goal_data in config_data.get('goals', [])
+            ]
         )
         
         # Set amount limits
         if config_data.get('min_amount'):
-            config.min_amount = FundingAmount(
-                config_data['min_amount'], 
-                config.preferred_currency
-            )
+            config.min_amount = self._amount(
+                config_data['min_amount'], preferred_currency)
         
         if config_data.get('max_amount'):
-            config.max_amount = FundingAmount(
-                config_data['max_amount'], 
-                config.preferred_currency
-            )
-        
-        # Add beneficiaries
-        for ben_data in config_data.get('beneficiaries', []):
-            beneficiary = Beneficiary(
-                name=ben_data['name'],
-                email=ben_data.get('email'),
-                github_username=ben_data.get('github'),
-                website=ben_data.get('website'),
-                description=ben_data.get('description')
-            )
-            config.add_beneficiary(beneficiary)
+            config.max_amount = self._amount(
+                config_data['max_amount'], preferred_currency)
         
-        # Add funding sources
-        for source_data in config_data.get('sources', []):
-            platform = self.platform_mapping.get(
+        return config
+    
+    # Flyweight cache for FundingAmount: tiers and goals across files reuse
+    # a handful of common (value, currency) pairs, and parsed amounts are
+    # never mutated, so sharing instances is safe. Bounded to keep batch
+    # parsing of many files from growing it without limit.
+    _AMOUNT_CACHE: Dict[tuple, FundingAmount] = {}
+    _AMOUNT_CACHE_MAX = 256
+    
+    def _amount(self, value: float, currency: CurrencyType) -> FundingAmount:
+        """Get a shared FundingAmount for a (value, currency) pair"""
+        key = (value, currency)
+        amount = self._AMOUNT_CACHE.get(key)
+        if amount is None:
+            amount = FundingAmount(value, currency)
+            if len(self._AMOUNT_CACHE) < self._AMOUNT_CACHE_MAX:
+                self._AMOUNT_CACHE[key] = amount
+        return amount
+    
+    def _build_source(self, source_data: Dict[str, Any]) -> FundingSource:
+        """Build a FundingSource from parsed source data"""
+        return FundingSource(
+            platform=self.platform_mapping.get(
                 source_data['platform'], FundingPlatform.CUSTOM
-            )
-            funding_type = self.funding_type_mapping.get(
+            ),
+            username=source_data['username'],
+            funding_type=self.funding_type_mapping.get(
                 source_data.get('type', 'both'), FundingType.BOTH
-            )
-            
-            source = FundingSource(
-                platform=platform,
-                username=source_data['username'],
-                funding_type=funding_type,
-                is_active=source_data.get('active', True),
-                custom_url=source_data.get('url'),
-                platform_specific_config=source_data.get('config', {})
-            )
-            config.add_funding_source(source)
+            ),
+            is_active=source_data.get('active', True),
+            custom_url=source_data.get('url'),
+            platform_specific_config=source_data.get('config', {})
+        )
+    
+    def _build_tier(self, tier_data: Dict[str, Any]) -> FundingTier:
+        """Build a FundingTier from parsed tier data"""
+        amount_data = tier_data['amount']
+        amount = self._amount(
+            amount_data['value'],
+            self.currency_mapping.get(amount_data['currency'], CurrencyType.USD)
+        )
         
-        # Add tiers
-        for tier_data in config_data.get('tiers', []):
-            amount_data = tier_data['amount']
-            amount = FundingAmount(
-                amount_data['value'],
-                self.currency_mapping.get(amount_data['currency'], CurrencyType.USD)
-            )
-            
-            tier = FundingTier(
-                name=tier_data['name'],
-                amount=amount,
-                description=tier_data.get('description'),
-                benefits=tier_data.get('benefits', []),
-                max_sponsors=int(tier_data['max_sponsors']) if tier_data.get('max_sponsors') else None
-            )
-            config.add_tier(tier)
+        return FundingTier(
+            name=tier_data['name'],
+            amount=amount,
+            description=tier_data.get('description'),
+            benefits=tier_data.get('benefits', []),
+            max_sponsors=int(tier_data['max_sponsors']) if tier_data.get('max_sponsors') else None
+        )
+    
+    def _build_goal(self, goal_data: Dict[str, Any]) -> FundingGoal:
+        """Build a FundingGoal from parsed goal data"""
+        target_data = goal_data['target_amount']
+        target_amount = self._amount(
+            target_data['value'],
+            self.currency_mapping.get(target_data['currency'], CurrencyType.USD)
+        )
         
-        # Add goals
-        for goal_data in config_data.get('goals', []):
-            target_data = goal_data['target_amount']
-            target_amount = FundingAmount(
-                target_data['value'],
-                self.currency_mapping.get(target_data['currency'], CurrencyType.USD)
-            )
-            
-            current_data = goal_data['current_amount']
-            current_amount = FundingAmount(
-                current_data['value'],
-                self.currency_mapping.get(current_data['currency'], CurrencyType.USD)
-            )
-            
-            deadline = None
-            if goal_data.get('deadline'):
-                try:
-                    deadline = datetime.strptime(goal_data['deadline'], '%Y-%m-%d')
-                except ValueError:
-                    pass  # Invalid date format, skip
-            
-            goal = FundingGoal(
-                name=goal_data['name'],
-                target_amount=target_amount,
-                current_amount=current_amount,
-                description=goal_data.get('description'),
-                deadline=deadline
-            )
-            config.add_goal(goal)
+        current_data = goal_data['current_amount']
+        current_amount = self._amount(
+            current_data['value'],
+            self.currency_mapping.get(current_data['currency'], CurrencyType.USD)
+        )
         
-        return config
+        deadline = None
+        if goal_data.get('deadline'):
+            try:
+                # C-implemented ISO parser; much cheaper than strptime,
+                # which interprets its format string on every call
+                deadline = datetime.fromisoformat(goal_data['deadline'])
+            except ValueError:
+                pass  # Invalid date format, skip
+        
+        return FundingGoal(
+            name=goal_data['name'],
+            target_amount=target_amount,
+            current_amount=current_amount,
+            description=goal_data.get('description'),
+            deadline=deadline
+        )
+
+
+# Shared parser instance for the module-level helpers; the parser keeps no
+# per-parse state, so one instance can serve every call
+_DEFAULT_PARSER: Optional[FundingDSLParser] = None
+
+
+def _get_parser() -> FundingDSLParser:
+    """Return the shared FundingDSLParser, creating it on first use"""
+    global _DEFAULT_PARSER
+    if _DEFAULT_PARSER is None:
+        _DEFAULT_PARSER = FundingDSLParser()
+    return _DEFAULT_PARSER
 
 
 def parse_funding_dsl_file(file_path: str) -> FundingConfiguration:
     """Parse a funding DSL file and return a FundingConfiguration object"""
-    parser = FundingDSLParser()
-    return parser.parse_file(file_path)
+    return _get_parser().parse_file(file_path)
 
 
 def parse_funding_dsl_text(text: str) -> FundingConfiguration:
     """Parse funding DSL text and return a FundingConfiguration object"""
-    parser = FundingDSLParser()
-    return parser.parse_text(text)
+    return _get_parser().parse_text(text)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,135 @@
+"""
+Ahead-of-time compiler for .funding files.
+
+compile_funding_file parses a DSL file once and emits a sibling .py file
+whose CONFIG constant rebuilds the same FundingConfiguration with plain
+constructor calls. Loading that module costs a bytecode-cached import
+instead of a full parse, which pays off when the same file is read
+repeatedly across processes. parse_funding_dsl_file_textx picks the
+compiled module up automatically while it is newer than the source.
+"""
+
+import importlib.util
+import os
+from typing import Optional
+
+from metamodel.funding_metamodel import (
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier,
+    FundingGoal, FundingAmount
+)
+
+_HEADER = '''\
+# Generated by textual_textx.funding_dsl_compiler; do not edit.
+# Rebuilds the configuration parsed from {source} without re-parsing.
+from datetime import datetime
+
+from metamodel.funding_metamodel import (
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier,
+    FundingGoal, FundingAmount, FundingPlatform, FundingType, CurrencyType
+)
+
+'''
+
+
+def _emit_amount(amount: Optional[FundingAmount]) -> str:
+    if amount is None:
+        return 'None'
+    return f'FundingAmount({amount.value!r}, CurrencyType.{amount.currency.name})'
+
+
+def _emit_beneficiary(ben: Beneficiary) -> str:
+    return (f'Beneficiary(name={ben.name!r}, email={ben.email!r}, '
+            f'github_username={ben.github_username!r}, '
+            f'website={ben.website!r}, description={ben.description!r})')
+
+
+def _emit_source(source: FundingSource) -> str:
+    return (f'FundingSource(platform=FundingPlatform.{source.platform.name}, '
+            f'username={source.username!r}, '
+            f'funding_type=FundingType.{source.funding_type.name}, '
+            f'is_active={source.is_active!r}, '
+            f'custom_url={source.custom_url!r}, '
+            f'platform_specific_config={source.platform_specific_config!r})')
+
+
+def _emit_tier(tier: FundingTier) -> str:
+    return (f'FundingTier(name={tier.name!r}, '
+            f'amount={_emit_amount(tier.amount)}, '
+            f'description={tier.description!r}, '
+            f'benefits={tier.benefits!r}, '
+            f'max_sponsors={tier.max_sponsors!r})')
+
+
+def _emit_goal(goal: FundingGoal) -> str:
+    if goal.deadline is not None:
+        d = goal.deadline
+        deadline = (f'datetime({d.year}, {d.month}, {d.day}, '
+                    f'{d.hour}, {d.minute}, {d.second})')
+    else:
+        deadline = 'None'
+    return (f'FundingGoal(name={goal.name!r}, '
+            f'target_amount={_emit_amount(goal.target_amount)}, '
+            f'description={goal.description!r}, '
+            f'deadline={deadline}, '
+            f'current_amount={_emit_amount(goal.current_amount)})')
+
+
+def _emit_list(items, emit_item) -> str:
+    if not items:
+        return '[]'
+    body = ',\n        '.join(emit_item(item) for item in items)
+    return f'[\n        {body},\n    ]'
+
+
+def compiled_path(file_path: str) -> str:
+    """Path of the compiled companion module for a .funding file"""
+    return file_path + '.py'
+
+
+def compile_funding_file(file_path: str) -> str:
+    """Parse a .funding file and emit its compiled companion module.
+
+    Returns the path of the generated .py file.
+    """
+    # Imported here: the parser module imports this one for the load path
+    from textual_textx.funding_dsl_textx_parser import _get_parser
+
+    config = _get_parser().parse_file(file_path)
+    lines = [
+        _HEADER.format(source=os.path.basename(file_path)),
+        'CONFIG = FundingConfiguration(',
+        f'    project_name={config.project_name!r},',
+        f'    description={config.description!r},',
+        f'    preferred_currency=CurrencyType.{config.preferred_currency.name},',
+        f'    beneficiaries={_emit_list(config.beneficiaries, _emit_beneficiary)},',
+        f'    funding_sources={_emit_list(config.funding_sources, _emit_source)},',
+        f'    tiers={_emit_list(config.tiers, _emit_tier)},',
+        f'    goals={_emit_list(config.goals, _emit_goal)},',
+        f'    min_amount={_emit_amount(config.min_amount)},',
+        f'    max_amount={_emit_amount(config.max_amount)},',
+        ')',
+        '',
+    ]
+    target = compiled_path(file_path)
+    with open(target, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+    return target
+
+
+def load_compiled(file_path: str) -> Optional[FundingConfiguration]:
+    """Load the compiled module for a .funding file if it is up to date.
+
+    Returns None when no compiled companion exists, it is older than the
+    source, or it fails to execute (e.g. generated by an older metamodel).
+    """
+    target = compiled_path(file_path)
+    try:
+        if os.stat(target).st_mtime < os.stat(file_path).st_mtime:
+            return None
+        spec = importlib.util.spec_from_file_location(
+            f'_funding_compiled_{abs(hash(target))}', target)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.CONFIG
+    except (OSError, AttributeError, SyntaxError, TypeError):
+        return None
@@ -0,0 +1,356 @@
+"""
+Hand-written fast parser for the Funding DSL.
+
+Implements the same language as funding_dsl.tx with a plain tokenizer and
+recursive-descent parser, building metamodel objects directly. The grammar
+is LL(1), so no generic PEG machinery is needed; this path is several times
+faster than textX per parse and has no grammar-compilation cost at all.
+
+Set FUNDING_DSL_FAST=1 to route the textX module helpers through it.
+"""
+
+import re
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from metamodel.funding_metamodel import (
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier,
+    FundingGoal, FundingAmount, FundingPlatform, FundingType,
+    CurrencyType
+)
+
+
+class FastParseError(Exception):
+    """Raised when the fast parser cannot parse the DSL text"""
+    pass
+
+
+# Single master pattern; whitespace and comments are skipped during
+# tokenization, everything else becomes a (kind, value) token
+_TOKEN = re.compile(r'''
+    (?P<SKIP>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<STRING>"[^"]*")
+  | (?P<NUMBER>\d+(?:\.\d+)?)
+  | (?P<IDENT>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<LBRACE>\{)
+  | (?P<RBRACE>\})
+  | (?P<LBRACKET>\[)
+  | (?P<RBRACKET>\])
+  | (?P<COMMA>,)
+''', re.VERBOSE | re.DOTALL)
+
+_PLATFORM_MAPPING = {
+    platform.value if platform is not FundingPlatform.GITHUB_SPONSORS
+    else 'github_sponsors': platform
+    for platform in FundingPlatform
+}
+
+_FUNDING_TYPE_MAPPING = {ft.value: ft for ft in FundingType}
+_CURRENCY_MAPPING = {currency.value: currency for currency in CurrencyType}
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    """Turn DSL text into (kind, value) tokens, skipping comments"""
+    tokens = []
+    append = tokens.append
+    pos = 0
+    length = len(text)
+    while pos < length:
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            raise FastParseError(
+                f"Unexpected character {text[pos]!r} at position {pos}")
+        kind = match.lastgroup
+        if kind != 'SKIP':
+            append((kind, match.group()))
+        pos = match.end()
+    return tokens
+
+
+class FundingDSLFastParser:
+    """Recursive-descent parser producing metamodel objects directly"""
+
+    def parse_file(self, file_path: str) -> FundingConfiguration:
+        """Parse a .funding file and return a FundingConfiguration object"""
+        try:
+            with open(file_path, 'rb') as f:
+                content = f.read().decode('utf-8')
+        except FileNotFoundError:
+            raise FastParseError(f"File not found: {file_path}")
+        return self.parse_text(content)
+
+    def parse_text(self, text: str) -> FundingConfiguration:
+        """Parse DSL text and return a FundingConfiguration object"""
+        self._tokens = _tokenize(text)
+        self._pos = 0
+        config = self._parse_funding()
+        if self._pos != len(self._tokens):
+            kind, value = self._tokens[self._pos]
+            raise FastParseError(f"Trailing input at token {value!r}")
+        return config
+
+    # Token-cursor helpers
+
+    def _peek(self) -> Tuple[str, str]:
+        if self._pos < len(self._tokens):
+            return self._tokens[self._pos]
+        return ('EOF', '')
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        self._pos += 1
+        return token
+
+    def _expect(self, kind: str) -> str:
+        token_kind, value = self._next()
+        if token_kind != kind:
+            raise FastParseError(f"Expected {kind}, got {value!r}")
+        return value
+
+    def _expect_keyword(self, keyword: str) -> None:
+        token_kind, value = self._next()
+        if token_kind != 'IDENT' or value != keyword:
+            raise FastParseError(f"Expected '{keyword}', got {value!r}")
+
+    def _string(self) -> str:
+        return self._expect('STRING')[1:-1]
+
+    def _number(self) -> float:
+        return float(self._expect('NUMBER'))
+
+    # Grammar rules
+
+    def _parse_funding(self) -> FundingConfiguration:
+        self._expect_keyword('funding')
+        name = self._string()
+        self._expect('LBRACE')
+
+        description = None
+        currency = CurrencyType.USD
+        min_amount = None
+        max_amount = None
+        beneficiaries: List[Beneficiary] = []
+        sources: List[FundingSource] = []
+        tiers: List[FundingTier] = []
+        goals: List[FundingGoal] = []
+
+        while self._peek()[0] == 'IDENT':
+            keyword = self._next()[1]
+            if keyword == 'description':
+                description = self._string()
+            elif keyword == 'currency':
+                currency = self._currency()
+            elif keyword == 'min_amount':
+                min_amount = self._number()
+            elif keyword == 'max_amount':
+                max_amount = self._number()
+            elif keyword == 'beneficiaries':
+                beneficiaries = self._parse_block('beneficiary',
+                                                  self._parse_beneficiary)
+            elif keyword == 'sources':
+                sources = self._parse_sources()
+            elif keyword == 'tiers':
+                tiers = self._parse_block('tier', self._parse_tier)
+            elif keyword == 'goals':
+                goals = self._parse_block('goal', self._parse_goal)
+            else:
+                raise FastParseError(f"Unexpected keyword {keyword!r}")
+        self._expect('RBRACE')
+
+        return FundingConfiguration(
+            project_name=name,
+            description=description,
+            preferred_currency=currency,
+            beneficiaries=beneficiaries,
+            funding_sources=sources,
+            tiers=tiers,
+            goals=goals,
+            min_amount=(FundingAmount(min_amount, currency)
+                        if min_amount is not None else None),
+            max_amount=(FundingAmount(max_amount, currency)
+                        if max_amount is not None else None)
+        )
+
+    def _parse_block(self, item_keyword, parse_item) -> list:
+        """Parse '{ <item_keyword> ... }' blocks of homogeneous items"""
+        self._expect('LBRACE')
+        items = []
+        while self._peek()[0] == 'IDENT':
+            self._expect_keyword(item_keyword)
+            items.append(parse_item())
+        self._expect('RBRACE')
+        return items
+
+    def _parse_beneficiary(self) -> Beneficiary:
+        name = self._string()
+        self._expect('LBRACE')
+        props = {}
+        while self._peek()[0] == 'IDENT':
+            keyword = self._next()[1]
+            if keyword in ('email', 'github', 'website', 'description'):
+                props[keyword] = self._string()
+            else:
+                raise FastParseError(
+                    f"Unexpected beneficiary property {keyword!r}")
+        self._expect('RBRACE')
+        return Beneficiary(
+            name=name,
+            email=props.get('email'),
+            github_username=props.get('github'),
+            website=props.get('website'),
+            description=props.get('description')
+        )
+
+    def _parse_sources(self) -> List[FundingSource]:
+        self._expect('LBRACE')
+        sources = []
+        while self._peek()[0] == 'IDENT':
+            keyword = self._next()[1]
+            if keyword == 'custom':
+                sources.append(self._parse_source(FundingPlatform.CUSTOM,
+                                                  is_custom=True))
+            elif keyword in _PLATFORM_MAPPING:
+                sources.append(self._parse_source(_PLATFORM_MAPPING[keyword]))
+            else:
+                raise FastParseError(f"Unknown platform {keyword!r}")
+        self._expect('RBRACE')
+        return sources
+
+    def _parse_source(self, platform: FundingPlatform,
+                      is_custom: bool = False) -> FundingSource:
+        username = self._string()
+        self._expect('LBRACE')
+
+        custom_url = None
+        funding_type = FundingType.BOTH
+        is_active = True
+        platform_config = {}
+
+        while self._peek()[0] == 'IDENT':
+            keyword = self._next()[1]
+            if keyword == 'url' and is_custom:
+                custom_url = self._string()
+            elif keyword == 'type':
+                value = self._expect('IDENT')
+                funding_type = _FUNDING_TYPE_MAPPING.get(value,
+                                                         FundingType.BOTH)
+            elif keyword == 'active':
+                is_active = self._expect('IDENT') == 'true'
+            elif keyword == 'config':
+                self._expect('LBRACE')
+                while self._peek()[0] == 'STRING':
+                    key = self._string()
+                    platform_config[key] = self._string()
+                self._expect('RBRACE')
+            else:
+                raise FastParseError(f"Unexpected source property {keyword!r}")
+        self._expect('RBRACE')
+
+        return FundingSource(
+            platform=platform,
+            username=username,
+            funding_type=funding_type,
+            is_active=is_active,
+            custom_url=custom_url,
+            platform_specific_config=platform_config
+        )
+
+    def _parse_tier(self) -> FundingTier:
+        name = self._string()
+        self._expect('LBRACE')
+
+        amount = None
+        description = None
+        max_sponsors = None
+        benefits: List[str] = []
+
+        while self._peek()[0] == 'IDENT':
+            keyword = self._next()[1]
+            if keyword == 'amount':
+                amount = self._amount()
+            elif keyword == 'description':
+                description = self._string()
+            elif keyword == 'max_sponsors':
+                max_sponsors = int(self._number())
+            elif keyword == 'benefits':
+                benefits = self._string_list()
+            else:
+                raise FastParseError(f"Unexpected tier property {keyword!r}")
+        self._expect('RBRACE')
+
+        if amount is None:
+            raise FastParseError(f"Tier {name!r} has no amount")
+        return FundingTier(
+            name=name,
+            amount=amount,
+            description=description,
+            benefits=benefits,
+            max_sponsors=max_sponsors
+        )
+
+    def _parse_goal(self) -> FundingGoal:
+        name = self._string()
+        self._expect('LBRACE')
+
+        target = None
+        current = None
+        deadline = None
+        description = None
+
+        while self._peek()[0] == 'IDENT':
+            keyword = self._next()[1]
+            if keyword == 'target':
+                target = self._amount()
+            elif keyword == 'current':
+                current = self._amount()
+            elif keyword == 'deadline':
+                try:
+                    deadline = datetime.fromisoformat(self._string())
+                except ValueError:
+                    deadline = None  # Invalid date format, keep as None
+            elif keyword == 'description':
+                description = self._string()
+            else:
+                raise FastParseError(f"Unexpected goal property {keyword!r}")
+        self._expect('RBRACE')
+
+        if target is None:
+            raise FastParseError(f"Goal {name!r} has no target")
+        return FundingGoal(
+            name=name,
+            target_amount=target,
+            current_amount=current or FundingAmount(0.0, target.currency),
+            description=description,
+            deadline=deadline
+        )
+
+    def _amount(self) -> FundingAmount:
+        value = self._number()
+        return FundingAmount(value, self._currency())
+
+    def _currency(self) -> CurrencyType:
+        value = self._expect('IDENT')
+        currency = _CURRENCY_MAPPING.get(value)
+        if currency is None:
+            raise FastParseError(f"Unknown currency {value!r}")
+        return currency
+
+    def _string_list(self) -> List[str]:
+        self._expect('LBRACKET')
+        items = []
+        while self._peek()[0] == 'STRING':
+            items.append(self._string())
+            if self._peek()[0] == 'COMMA':
+                self._next()
+        self._expect('RBRACKET')
+        return items
+
+
+def parse_funding_dsl_file_fast(file_path: str) -> FundingConfiguration:
+    """Parse a funding DSL file with the fast parser"""
+    return FundingDSLFastParser().parse_file(file_path)
+
+
+def parse_funding_dsl_text_fast(text: str) -> FundingConfiguration:
+    """Parse funding DSL text with the fast parser"""
+    return FundingDSLFastParser().parse_text(text)
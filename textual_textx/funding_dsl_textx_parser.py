@@ -3,12 +3,20 @@ TextX-based Funding DSL Parser
 Uses TextX grammar to parse DSL files and convert to metamodel objects.
 """
 
+import copy
+import functools
 import os
+import sys
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
 
 from textx import metamodel_from_file, TextXSyntaxError
+from textual_textx.funding_dsl_lark_parser import (
+    LARK_AVAILABLE as _LARK_AVAILABLE, parse_with_lark as _parse_with_lark
+)
 from metamodel.funding_metamodel import (
     FundingConfiguration, Beneficiary, FundingSource, FundingTier, 
     FundingGoal, FundingAmount, FundingPlatform, FundingType, 
@@ -21,54 +29,147 @@ class TextXParseError(Exception):
     pass
 
 
+# Keyword-to-enum tables shared by every parser instance; built once at
+# import instead of per construction
+_PLATFORM_MAPPING = {
+    'github_sponsors': FundingPlatform.GITHUB_SPONSORS,
+    'patreon': FundingPlatform.PATREON,
+    'ko_fi': FundingPlatform.KO_FI,
+    'open_collective': FundingPlatform.OPEN_COLLECTIVE,
+    'buy_me_a_coffee': FundingPlatform.BUY_ME_A_COFFEE,
+    'liberapay': FundingPlatform.LIBERAPAY,
+    'paypal': FundingPlatform.PAYPAL,
+    'tidelift': FundingPlatform.TIDELIFT,
+    'issuehunt': FundingPlatform.ISSUEHUNT,
+    'community_bridge': FundingPlatform.COMMUNITY_BRIDGE,
+    'polar': FundingPlatform.POLAR,
+    'thanks_dev': FundingPlatform.THANKS_DEV,
+    'custom': FundingPlatform.CUSTOM
+}
+
+_FUNDING_TYPE_MAPPING = {
+    'one_time': FundingType.ONE_TIME,
+    'recurring': FundingType.RECURRING,
+    'both': FundingType.BOTH
+}
+
+_CURRENCY_MAPPING = {
+    'USD': CurrencyType.USD,
+    'EUR': CurrencyType.EUR,
+    'GBP': CurrencyType.GBP,
+    'CAD': CurrencyType.CAD,
+    'AUD': CurrencyType.AUD
+}
+
+# Interning the keys (and the runtime strings probed against them, see the
+# transform methods) lets dict lookup take CPython's pointer-equality fast
+# path instead of comparing characters
+_PLATFORM_MAPPING = {sys.intern(key): value for key, value in _PLATFORM_MAPPING.items()}
+_FUNDING_TYPE_MAPPING = {sys.intern(key): value for key, value in _FUNDING_TYPE_MAPPING.items()}
+_CURRENCY_MAPPING = {sys.intern(key): value for key, value in _CURRENCY_MAPPING.items()}
+
+
+# String helpers live at module level so the transform methods can bind
+# them to locals, paying one global load instead of a bound-method call
+# per optional field
+
+def _clean_string(s: str) -> str:
+    """Remove quotes from string literals"""
+    # Direct indexing beats two method calls on this per-token hot path
+    if len(s) >= 2 and s[0] == '"' and s[-1] == '"':
+        return s[1:-1]
+    return s
+
+
+def _get_optional_string_value(elem) -> Optional[str]:
+    """Get string value from optional TextX element"""
+    if elem:
+        return _clean_string(elem.value)
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_metamodel(grammar_path: str, mtime: float):
+    """Compile the textX grammar once per (path, mtime).
+
+    Building the metamodel reads and compiles the .tx grammar, which is the
+    dominant fixed cost of textX for small inputs. Keying on the file's
+    mtime means an edited grammar is picked up without restarting, while
+    repeat loads are a cache hit. memoization stays off: for the small
+    models this DSL describes, the packrat memoization table costs more
+    time and memory than it saves.
+    """
+    return metamodel_from_file(grammar_path, memoization=False)
+
+
 class FundingDSLTextXParser:
     """TextX-based parser that converts DSL text to metamodel objects"""
-    
-    def __init__(self):
+
+    # The lock keeps concurrent first-time loads from compiling the grammar
+    # twice (the textX grammar compiler is not re-entrant);
+    # _shared_metamodel mirrors the cached instance for introspection
+    _shared_metamodel = None
+    _metamodel_lock = threading.Lock()
+
+    @classmethod
+    def _get_metamodel(cls, grammar_file):
+        """Load the textX metamodel once and reuse it for every parser"""
+        with cls._metamodel_lock:
+            cls._shared_metamodel = _load_metamodel(
+                str(grammar_file), grammar_file.stat().st_mtime
+            )
+        return cls._shared_metamodel
+
+    # Mapping dictionaries for enum conversion, shared across instances
+    platform_mapping = _PLATFORM_MAPPING
+    funding_type_mapping = _FUNDING_TYPE_MAPPING
+    currency_mapping = _CURRENCY_MAPPING
+
+    # Upper bound for the opt-in parse_text result cache
+    _TEXT_CACHE_MAX = 128
+
+    def __init__(self, cache_results: bool = False):
+        # Opt-in memoization of parse_text by input text: repeat parses of
+        # an identical string return a deep copy of the cached
+        # configuration instead of re-running the textX traversal
+        self._text_cache: Optional[OrderedDict] = (
+            OrderedDict() if cache_results else None
+        )
+
+        # Element-local validation problems found while transforming the
+        # last parsed model; see the errors property
+        self._errors: List[str] = []
+
         # Load the TextX grammar
         self.grammar_file = Path(__file__).parent / "funding_dsl.tx"
         if not self.grammar_file.exists():
             raise TextXParseError(f"Grammar file not found: {self.grammar_file}")
         
         try:
-            self.metamodel = metamodel_from_file(str(self.grammar_file))
+            self.metamodel = self._get_metamodel(self.grammar_file)
         except Exception as e:
             raise TextXParseError(f"Error loading TextX grammar: {e}")
-        
-        # Mapping dictionaries for enum conversion
-        self.platform_mapping = {
-            'github_sponsors': FundingPlatform.GITHUB_SPONSORS,
-            'patreon': FundingPlatform.PATREON,
-            'ko_fi': FundingPlatform.KO_FI,
-            'open_collective': FundingPlatform.OPEN_COLLECTIVE,
-            'buy_me_a_coffee': FundingPlatform.BUY_ME_A_COFFEE,
-            'liberapay': FundingPlatform.LIBERAPAY,
-            'paypal': FundingPlatform.PAYPAL,
-            'tidelift': FundingPlatform.TIDELIFT,
-            'issuehunt': FundingPlatform.ISSUEHUNT,
-            'community_bridge': FundingPlatform.COMMUNITY_BRIDGE,
-            'polar': FundingPlatform.POLAR,
-            'thanks_dev': FundingPlatform.THANKS_DEV,
-            'custom': FundingPlatform.CUSTOM
-        }
-        
-        self.funding_type_mapping = {
-            'one_time': FundingType.ONE_TIME,
-            'recurring': FundingType.RECURRING,
-            'both': FundingType.BOTH
-        }
-        
-        self.currency_mapping = {
-            'USD': CurrencyType.USD,
-            'EUR': CurrencyType.EUR,
-            'GBP': CurrencyType.GBP,
-            'CAD': CurrencyType.CAD,
-            'AUD': CurrencyType.AUD
-        }
     
+    @property
+    def errors(self) -> List[str]:
+        """Element-local validation errors collected during the last parse.
+
+        The per-element rules (source usernames, custom URLs, platform
+        username formats, non-negative amounts) are checked while each
+        element is transformed, so a separate full walk of the model is
+        unnecessary for them. Cross-element rules (uniqueness, min/max
+        consistency) remain with FundingModelValidator.
+        """
+        return list(self._errors)
+
     def parse_file(self, file_path: str) -> FundingConfiguration:
         """Parse a .funding file and return a FundingConfiguration object"""
         try:
+            self._errors = []
+            if _LARK_AVAILABLE:
+                # Lark(LALR) backend: same language, ~2-5x faster parse
+                with open(file_path, encoding='utf-8') as f:
+                    return self._parse_lark(f.read())
             # Parse with TextX
             textx_model = self.metamodel.model_from_file(file_path)
             return self._transform_model(textx_model)
@@ -76,114 +177,156 @@ class FundingDSLTextXParser:
             raise TextXParseError(f"File not found: {file_path}")
         except TextXSyntaxError as e:
             raise TextXParseError(f"Syntax error in {file_path}: {e}")
+        except TextXParseError:
+            raise
         except Exception as e:
             raise TextXParseError(f"Error parsing file {file_path}: {str(e)}")
     
     def parse_text(self, text: str) -> FundingConfiguration:
         """Parse DSL text and return a FundingConfiguration object"""
+        cache = self._text_cache
+        if cache is not None:
+            cached = cache.get(text)
+            if cached is not None:
+                cache.move_to_end(text)
+                cached_config, cached_errors = cached
+                self._errors = list(cached_errors)
+                # Deep copy keeps callers from mutating the cached graph
+                return copy.deepcopy(cached_config)
+
         try:
-            # Parse with TextX
-            textx_model = self.metamodel.model_from_str(text)
-            return self._transform_model(textx_model)
+            self._errors = []
+            if _LARK_AVAILABLE:
+                config = self._parse_lark(text)
+            else:
+                # Parse with TextX
+                textx_model = self.metamodel.model_from_str(text)
+                config = self._transform_model(textx_model)
         except TextXSyntaxError as e:
             raise TextXParseError(f"Syntax error: {e}")
+        except TextXParseError:
+            raise
         except Exception as e:
             raise TextXParseError(f"Parse error: {str(e)}")
+
+        if cache is not None:
+            cache[text] = (copy.deepcopy(config), tuple(self._errors))
+            if len(cache) > self._TEXT_CACHE_MAX:
+                cache.popitem(last=False)
+        return config
     
+    def _parse_lark(self, text: str) -> FundingConfiguration:
+        """Parse with the Lark backend, mapping its errors to TextXParseError"""
+        from lark.exceptions import UnexpectedInput
+        try:
+            return _parse_with_lark(text, self._errors)
+        except UnexpectedInput as e:
+            raise TextXParseError(f"Syntax error: {e}")
+
     def _transform_model(self, textx_model) -> FundingConfiguration:
         """Transform TextX model object to our metamodel objects"""
         
-        # Create the main configuration
-        config = FundingConfiguration(
-            project_name=self._clean_string(textx_model.name),
-            description=self._get_optional_string_value(textx_model.description),
-            preferred_currency=self._get_currency(textx_model.currency)
+        # Read each textX block attribute once; the element lists then feed
+        # comprehensions passed straight to the constructor, skipping the
+        # per-item add_* calls
+        beneficiaries_block = textx_model.beneficiaries
+        sources_block = textx_model.sources
+        tiers_block = textx_model.tiers
+        goals_block = textx_model.goals
+        preferred_currency = self._get_currency(textx_model.currency)
+
+        return FundingConfiguration(
+            project_name=_clean_string(textx_model.name),
+            description=_get_optional_string_value(textx_model.description),
+            preferred_currency=preferred_currency,
+            beneficiaries=[
+                self._transform_beneficiary(ben_elem)
+                for ben_elem in (beneficiaries_block.beneficiaries
+                                 if beneficiaries_block else ())
+            ],
+            funding_sources=[
+                self._transform_source(source_elem)
+                for source_elem in (sources_block.sources if sources_block else ())
+            ],
+            tiers=[
+                self._transform_tier(tier_elem)
+                for tier_elem in (tiers_block.tiers if tiers_block else ())
+            ],
+            goals=[
+                self._transform_goal(goal_elem)
+                for goal_elem in (goals_block.goals if goals_block else ())
+            ],
+            min_amount=(FundingAmount(textx_model.min_amount.value,
+                                      preferred_currency)
+                        if textx_model.min_amount else None),
+            max_amount=(FundingAmount(textx_model.max_amount.value,
+                                      preferred_currency)
+                        if textx_model.max_amount else None)
         )
-        
-        # Set amount limits
-        if textx_model.min_amount:
-            config.min_amount = FundingAmount(
-                textx_model.min_amount.value, 
-                config.preferred_currency
-            )
-        
-        if textx_model.max_amount:
-            config.max_amount = FundingAmount(
-                textx_model.max_amount.value, 
-                config.preferred_currency
-            )
-        
-        # Transform beneficiaries
-        if textx_model.beneficiaries:
-            for ben_elem in textx_model.beneficiaries.beneficiaries:
-                beneficiary = self._transform_beneficiary(ben_elem)
-                config.add_beneficiary(beneficiary)
-        
-        # Transform funding sources
-        if textx_model.sources:
-            for source_elem in textx_model.sources.sources:
-                source = self._transform_source(source_elem)
-                config.add_funding_source(source)
-        
-        # Transform tiers
-        if textx_model.tiers:
-            for tier_elem in textx_model.tiers.tiers:
-                tier = self._transform_tier(tier_elem)
-                config.add_tier(tier)
-        
-        # Transform goals
-        if textx_model.goals:
-            for goal_elem in textx_model.goals.goals:
-                goal = self._transform_goal(goal_elem)
-                config.add_goal(goal)
-        
-        return config
     
     def _transform_beneficiary(self, ben_elem) -> Beneficiary:
         """Transform TextX beneficiary element to Beneficiary object"""
+        _opt = _get_optional_string_value
         return Beneficiary(
-            name=self._clean_string(ben_elem.name),
-            email=self._get_optional_string_value(ben_elem.email),
-            github_username=self._get_optional_string_value(ben_elem.github),
-            website=self._get_optional_string_value(ben_elem.website),
-            description=self._get_optional_string_value(ben_elem.description)
+            name=_clean_string(ben_elem.name),
+            email=_opt(ben_elem.email),
+            github_username=_opt(ben_elem.github),
+            website=_opt(ben_elem.website),
+            description=_opt(ben_elem.description)
         )
     
     def _transform_source(self, source_elem) -> FundingSource:
         """Transform TextX source element to FundingSource object"""
-        
+        # Bind the hot helpers locally once; every value below then avoids
+        # repeated attribute lookups on self
+        clean = _clean_string
+
         # Handle platform sources vs custom sources
         if hasattr(source_elem, 'platform'):
             # Platform source
-            platform = self.platform_mapping.get(source_elem.platform, FundingPlatform.CUSTOM)
-            username = self._clean_string(source_elem.username)
+            platform = self.platform_mapping.get(
+                sys.intern(source_elem.platform), FundingPlatform.CUSTOM)
+            username = clean(source_elem.username)
             custom_url = None
         else:
             # Custom source
             platform = FundingPlatform.CUSTOM
-            username = self._clean_string(source_elem.name)
-            custom_url = self._get_optional_string_value(source_elem.url)
-        
-        # Get funding type
-        funding_type = FundingType.BOTH  # default
-        if source_elem.type:
-            funding_type = self.funding_type_mapping.get(
-                source_elem.type.value, FundingType.BOTH
-            )
-        
-        # Get active status
-        is_active = True  # default
-        if source_elem.active:
-            is_active = source_elem.active.value
-        
-        # Get platform config
-        platform_config = {}
-        if source_elem.config:
-            for config_kv in source_elem.config.configs:
-                key = self._clean_string(config_kv.key)
-                value = self._clean_string(config_kv.value)
-                platform_config[key] = value
-        
+            username = clean(source_elem.name)
+            custom_url = _get_optional_string_value(source_elem.url)
+
+        type_elem = source_elem.type
+        funding_type = (self.funding_type_mapping.get(sys.intern(type_elem.value),
+                                                      FundingType.BOTH)
+                        if type_elem else FundingType.BOTH)
+
+        active_elem = source_elem.active
+        is_active = active_elem.value if active_elem else True
+
+        # Single C-level dict build instead of per-key __setitem__ calls
+        config_elem = source_elem.config
+        platform_config = (
+            {clean(kv.key): clean(kv.value) for kv in config_elem.configs}
+            if config_elem else {}
+        )
+
+        # Source-local validation, checked while the element is in hand so
+        # no second walk over the sources is needed
+        errors = self._errors
+        if not username:
+            errors.append(f"Username is required for {platform.value}")
+        if platform == FundingPlatform.CUSTOM and not custom_url:
+            errors.append("Custom URL is required for custom platforms")
+        elif platform == FundingPlatform.TIDELIFT:
+            if '/' not in username:
+                errors.append("Tidelift username must be in format "
+                              "'platform-name/package-name' (e.g., 'npm/package-name')")
+            elif username.split('/')[0] not in (
+                    'npm', 'pypi', 'rubygems', 'maven', 'packagist', 'nuget'):
+                errors.append("Tidelift platform name must be one of: "
+                              "npm, pypi, rubygems, maven, packagist, nuget")
+        elif platform == FundingPlatform.THANKS_DEV and not username.startswith('u/gh/'):
+            errors.append("Thanks.dev username must be in format 'u/gh/username'")
+
         return FundingSource(
             platform=platform,
             username=username,
@@ -202,17 +345,21 @@ class FundingDSLTextXParser:
         # Get benefits list
         benefits = []
         if tier_elem.benefits:
-            benefits = [self._clean_string(benefit) for benefit in tier_elem.benefits.benefits]
+            benefits = [_clean_string(benefit) for benefit in tier_elem.benefits.benefits]
         
         # Get max sponsors
         max_sponsors = None
         if tier_elem.max_sponsors:
             max_sponsors = tier_elem.max_sponsors.value
-        
+
+        if amount.value < 0.0:
+            self._errors.append(
+                f"Tier '{_clean_string(tier_elem.name)}' amount must be non-negative")
+
         return FundingTier(
-            name=self._clean_string(tier_elem.name),
+            name=_clean_string(tier_elem.name),
             amount=amount,
-            description=self._get_optional_string_value(tier_elem.description),
+            description=_get_optional_string_value(tier_elem.description),
             benefits=benefits,
             max_sponsors=max_sponsors
         )
@@ -230,54 +377,93 @@ class FundingDSLTextXParser:
         # Parse deadline
         deadline = None
         if goal_elem.deadline:
-            deadline_str = self._clean_string(goal_elem.deadline.value)
+            deadline_str = _clean_string(goal_elem.deadline.value)
             try:
-                deadline = datetime.strptime(deadline_str, '%Y-%m-%d')
+                # The DSL fixes deadlines to YYYY-MM-DD, so the
+                # C-implemented ISO parser replaces strptime's
+                # format-string interpreter
+                deadline = datetime.fromisoformat(deadline_str)
             except ValueError:
                 pass  # Invalid date format, keep as None
         
+        if target_amount.value < 0.0 or current_amount.value < 0.0:
+            self._errors.append(
+                f"Goal '{_clean_string(goal_elem.name)}' amounts must be non-negative")
+
         return FundingGoal(
-            name=self._clean_string(goal_elem.name),
+            name=_clean_string(goal_elem.name),
             target_amount=target_amount,
             current_amount=current_amount,
-            description=self._get_optional_string_value(goal_elem.description),
+            description=_get_optional_string_value(goal_elem.description),
             deadline=deadline
         )
     
     def _transform_amount(self, amount_elem) -> FundingAmount:
         """Transform TextX amount element to FundingAmount object"""
-        currency = self.currency_mapping.get(amount_elem.currency, CurrencyType.USD)
+        currency = self.currency_mapping.get(
+            sys.intern(amount_elem.currency), CurrencyType.USD)
         return FundingAmount(amount_elem.value, currency)
     
     def _get_currency(self, currency_elem) -> CurrencyType:
         """Get currency type from TextX element"""
         if currency_elem:
-            return self.currency_mapping.get(currency_elem.value, CurrencyType.USD)
+            return self.currency_mapping.get(
+                sys.intern(currency_elem.value), CurrencyType.USD)
         return CurrencyType.USD
     
-    def _get_optional_string_value(self, elem) -> Optional[str]:
-        """Get string value from optional TextX element"""
-        if elem:
-            return self._clean_string(elem.value)
-        return None
-    
-    def _clean_string(self, s: str) -> str:
-        """Remove quotes from string literals"""
-        if s.startswith('"') and s.endswith('"'):
-            return s[1:-1]
-        return s
+    # Aliases for the module-level helpers below, kept for callers that
+    # reach them through the class
+    _get_optional_string_value = staticmethod(_get_optional_string_value)
+    _clean_string = staticmethod(_clean_string)
+
+
+# Shared parser for the module-level helpers: the parser itself is
+# stateless between parses, so one instance serves every call
+_DEFAULT_PARSER: Optional[FundingDSLTextXParser] = None
+
+
+def _get_parser() -> FundingDSLTextXParser:
+    """Return the shared FundingDSLTextXParser, creating it on first use"""
+    global _DEFAULT_PARSER
+    if _DEFAULT_PARSER is None:
+        _DEFAULT_PARSER = FundingDSLTextXParser()
+    return _DEFAULT_PARSER
+
+
+# With FUNDING_DSL_FAST=1 the module helpers go through the hand-written
+# recursive-descent parser (no grammar compilation, much faster per parse),
+# falling back to textX if the fast parser rejects the input
+_USE_FAST_PARSER = os.environ.get('FUNDING_DSL_FAST', '') == '1'
 
 
 def parse_funding_dsl_file_textx(file_path: str) -> FundingConfiguration:
     """Parse a funding DSL file using TextX and return a FundingConfiguration object"""
-    parser = FundingDSLTextXParser()
-    return parser.parse_file(file_path)
+    # A compiled companion module (see funding_dsl_compiler) turns repeated
+    # loads of the same file into a plain import
+    from textual_textx.funding_dsl_compiler import load_compiled
+    compiled = load_compiled(file_path)
+    if compiled is not None:
+        return compiled
+    if _USE_FAST_PARSER:
+        from textual_textx.funding_dsl_fast_parser import (
+            FastParseError, parse_funding_dsl_file_fast)
+        try:
+            return parse_funding_dsl_file_fast(file_path)
+        except FastParseError:
+            pass
+    return _get_parser().parse_file(file_path)
 
 
 def parse_funding_dsl_text_textx(text: str) -> FundingConfiguration:
     """Parse funding DSL text using TextX and return a FundingConfiguration object"""
-    parser = FundingDSLTextXParser()
-    return parser.parse_text(text)
+    if _USE_FAST_PARSER:
+        from textual_textx.funding_dsl_fast_parser import (
+            FastParseError, parse_funding_dsl_text_fast)
+        try:
+            return parse_funding_dsl_text_fast(text)
+        except FastParseError:
+            pass
+    return _get_parser().parse_text(text)
 
 
 if __name__ == "__main__":